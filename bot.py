@@ -3,8 +3,6 @@ from datetime import datetime
 # from pocketoptionapi.stable_api import PocketOption # Now handled by pocket_connector
 import pocketoptionapi.global_value as global_value
 # import talib.abstract as ta
-import numpy as np
-import pandas as pd
 # from tools import indicators as qtpylib
 
 # Import the new connector and the signal detector
@@ -22,6 +20,19 @@ global_value.loglevel = 'DEBUG' # Changed to DEBUG for more verbose Telethon log
 # Session configuration
 start_counter = time.perf_counter()
 
+def _make_worker_context():
+    """Multiprocessing context for the account workers: forkserver where available, spawn otherwise (Windows)"""
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context('forkserver')
+        # The fork server imports the worker module (and the PocketOption API under it) once;
+        # each worker is then forked from that clean, already-warm process
+        ctx.set_forkserver_preload(['worker'])
+        return ctx
+    return multiprocessing.get_context('spawn')
+
+# One multiprocessing context for every worker process and its queues, so the start method is chosen in one place
+_worker_ctx = _make_worker_context()
+
 # --- Database Configuration and Account Management ---
 def initialize_database_and_accounts():
     """Initialize database connection and load accounts from database"""
@@ -93,6 +104,11 @@ class PocketWorkerManager:
         self.workers = {}
         self.running = True
         self.result_monitor_thread = None
+        # Worker response status -> handler(worker_name, response)
+        self._resp_handlers = {
+            'trade_completed': self._on_trade_completed,
+            'trade_timeout': self._on_trade_timeout,
+        }
     
     def start_result_monitoring(self):
         """Start background thread to monitor trade results from workers"""
@@ -126,39 +142,40 @@ class PocketWorkerManager:
         """Handle responses from workers, especially trade results"""
         if not response:
             return
-            
-        status = response.get('status')
         
-        if status == 'trade_completed':
-            # Trade result received - update Martingale system
-            data = response.get('data', {})
-            trade_id = data.get('trade_id')
-            profit = data.get('profit')
-            result = data.get('result')  # "win" or "loose"
-            
-            global_value.logger(f"[WorkerManager] Trade result received from {worker_name}: {trade_id} -> {result} (${profit})", "INFO")
-            
-            # Import detectsignal to call the result handler
-            try:
-                from detectsignal import _handle_trade_result
-                # Convert "loose" to "loss" for consistency
-                result_status = "win" if result == "win" else "loss"
-                symbol = data.get('symbol', 'unknown_symbol')  # Get symbol from trade data
-                _handle_trade_result(trade_id, symbol, result_status, profit, worker_name)
-                global_value.logger(f"[WorkerManager] Updated Martingale system with trade {trade_id} result: {result_status} for account {worker_name}", "INFO")
-            except Exception as e:
-                global_value.logger(f"[WorkerManager] Error updating Martingale system: {e}", "ERROR")
-                
-        elif status == 'trade_timeout':
-            # Trade monitoring timed out
-            data = response.get('data', {})
-            trade_id = data.get('trade_id')
-            global_value.logger(f"[WorkerManager] Trade monitoring timeout for {trade_id} from {worker_name}", "WARNING")
-            
+        handler = self._resp_handlers.get(response.get('status'))
+        if handler:
+            handler(worker_name, response)
         else:
             # Regular command response - log for debugging
             global_value.logger(f"[WorkerManager] Response from {worker_name}: {response}", "DEBUG")
 
+    def _on_trade_completed(self, worker_name, response):
+        """Trade result received - update Martingale system"""
+        data = response.get('data', {})
+        trade_id = data.get('trade_id')
+        profit = data.get('profit')
+        result = data.get('result')  # "win" or "loose"
+        
+        global_value.logger(f"[WorkerManager] Trade result received from {worker_name}: {trade_id} -> {result} (${profit})", "INFO")
+        
+        # Import detectsignal to call the result handler
+        try:
+            # Convert "loose" to "loss" for consistency
+            result_status = "win" if result == "win" else "loss"
+            symbol = data.get('symbol', 'unknown_symbol')  # Get symbol from trade data
+            from detectsignal import _handle_trade_result
+            _handle_trade_result(trade_id, symbol, result_status, profit, worker_name)
+            global_value.logger(f"[WorkerManager] Updated Martingale system with trade {trade_id} result: {result_status} for account {worker_name}", "INFO")
+        except Exception as e:
+            global_value.logger(f"[WorkerManager] Error updating Martingale system: {e}", "ERROR")
+
+    def _on_trade_timeout(self, worker_name, response):
+        """Trade monitoring timed out - nothing to apply, just log it"""
+        data = response.get('data', {})
+        trade_id = data.get('trade_id')
+        global_value.logger(f"[WorkerManager] Trade monitoring timeout for {trade_id} from {worker_name}", "WARNING")
+
     def _start_workers(self):
         if not self.configs:
             global_value.logger("[WorkerManager] No PocketOption accounts configured. Workers not started.", "WARNING")
@@ -172,9 +189,9 @@ class PocketWorkerManager:
 
         for config in enabled_configs:
             name = config['name']
-            cmd_q = multiprocessing.Queue()
-            resp_q = multiprocessing.Queue()
-            process = multiprocessing.Process(
+            cmd_q = _worker_ctx.Queue()
+            resp_q = _worker_ctx.Queue()
+            process = _worker_ctx.Process(
                 target=worker.po_worker_main, # Target the main function in worker.py
                 args=(name, config['ssid'], config['demo'], cmd_q, resp_q),
                 name=f"PocketWorker-{name}"
@@ -21,6 +21,10 @@ import os
 import logging
 
 class DatabaseManager:
+    # Bump whenever _check_and_migrate_schema/_migrate_martingale_table learn a new migration,
+    # so existing databases run the column checks once more
+    SCHEMA_VERSION = 1
+    
     def __init__(self, db_type=None, **kwargs):
         """
         Initialize database manager
@@ -329,14 +333,29 @@ class DatabaseManager:
         )
         """
         
+        # Key/value metadata, currently just the applied schema version
+        meta_table = """
+        CREATE TABLE IF NOT EXISTS meta (
+            name VARCHAR(64) PRIMARY KEY,
+            value VARCHAR(255)
+        )
+        """ if self.db_type == "mysql" else """
+        CREATE TABLE IF NOT EXISTS meta (
+            name TEXT PRIMARY KEY,
+            value TEXT
+        )
+        """
+        
         # Execute table creation
         self._execute_query(accounts_table)
         self._execute_query(trades_table)
         self._execute_query(martingale_state_table)
         self._execute_query(performance_table)
+        self._execute_query(meta_table)
         
-        # Check and migrate existing schema if needed
-        self._check_and_migrate_schema()
+        # Check and migrate existing schema if needed (skipped once this version has been applied)
+        if self.get_schema_version() != self.SCHEMA_VERSION:
+            self._check_and_migrate_schema()
         
         # Initialize Martingale state if not exists
         self._initialize_martingale_state()
@@ -349,6 +368,27 @@ class DatabaseManager:
         # Account-specific states will be initialized when accounts are first used
         self.logger.info("Martingale state table ready for per-account states")
     
+    def get_schema_version(self) -> Optional[int]:
+        """Schema version recorded by the last successful migration check, or None if there is none"""
+        try:
+            query = "SELECT value FROM meta WHERE name = %s" if self.db_type == "mysql" else "SELECT value FROM meta WHERE name = ?"
+            result = self._execute_query(query, ('schema_version',), fetch="one")
+            return int(result[0]) if result else None
+        except Exception as e:
+            self.logger.warning(f"Could not read schema version: {e}")
+            return None
+    
+    def _set_schema_version(self, version: int):
+        """Record the schema version in the meta table"""
+        query = """
+        INSERT INTO meta (name, value) VALUES (%s, %s)
+        ON DUPLICATE KEY UPDATE value = VALUES(value)
+        """ if self.db_type == "mysql" else """
+        INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)
+        """
+        self._execute_query(query, ('schema_version', str(version)))
+        self.logger.info(f"Database schema version set to {version}")
+    
     def _check_and_migrate_schema(self):
         """Check if schema needs migration and apply updates"""
         try:
@@ -453,14 +493,15 @@ class DatabaseManager:
                 self._execute_query(migrate_query)
                 self.logger.info("Successfully added 'martingale_enabled' column to accounts table")
             
-            # Check and migrate martingale_state table
-            self._migrate_martingale_table()
+            # Check and migrate martingale_state table; record the version only when everything applied
+            if self._migrate_martingale_table():
+                self._set_schema_version(self.SCHEMA_VERSION)
                 
         except Exception as e:
             self.logger.warning(f"Schema migration check failed (this is normal for new installations): {e}")
     
     def _migrate_martingale_table(self):
-        """Migrate martingale_state table to include missing columns"""
+        """Migrate martingale_state table to include missing columns; returns True on success"""
         try:
             # Check if martingale_state table exists and get its columns
             if self.db_type == "mysql":
@@ -501,18 +542,17 @@ class DatabaseManager:
                 self._execute_query("DELETE FROM martingale_state WHERE account_name IS NULL OR account_name = ''")
             
             self.logger.info("Martingale table migration completed")
+            return True
             
         except Exception as e:
             self.logger.warning(f"Martingale table migration failed: {e}")
+            return False
     
     # === ACCOUNT MANAGEMENT ===
     
-    def add_account(self, worker_name: str, ssid: str, is_demo: bool, enabled: bool = True, 
-                   balance: float = 0.00, base_amount: float = 1.00, martingale_multiplier: float = 2.00, 
-                   martingale_enabled: bool = True) -> bool:
-        """Add or update a PocketOption account"""
-        try:
-            query = """
+    def _account_upsert_query(self) -> str:
+        """INSERT-or-update statement for one accounts row, in this backend's dialect"""
+        return """
             INSERT INTO accounts (worker_name, ssid, is_demo, enabled, balance, base_amount, 
                                 martingale_multiplier, martingale_enabled, last_updated)
             VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
@@ -531,22 +571,28 @@ class DatabaseManager:
                                           base_amount, martingale_multiplier, martingale_enabled, last_updated)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """
-            
-            current_time = datetime.now()
-            
-            # Convert boolean values to integers for MySQL compatibility
-            if self.db_type == "mysql":
-                is_demo_val = int(is_demo)
-                enabled_val = int(enabled) 
-                martingale_enabled_val = int(martingale_enabled)
-            else:
-                is_demo_val = is_demo
-                enabled_val = enabled
-                martingale_enabled_val = martingale_enabled
-            
-            params = (worker_name, ssid, is_demo_val, enabled_val, balance, base_amount, 
-                     martingale_multiplier, martingale_enabled_val, current_time)
-            self._execute_query(query, params)
+    
+    def _account_params(self, worker_name: str, ssid: str, is_demo: bool, enabled: bool = True, 
+                        balance: float = 0.00, base_amount: float = 1.00, martingale_multiplier: float = 2.00, 
+                        martingale_enabled: bool = True, current_time: datetime = None) -> tuple:
+        """Parameter tuple matching _account_upsert_query for one account"""
+        # Convert boolean values to integers for MySQL compatibility
+        if self.db_type == "mysql":
+            is_demo = int(is_demo)
+            enabled = int(enabled)
+            martingale_enabled = int(martingale_enabled)
+        
+        return (worker_name, ssid, is_demo, enabled, balance, base_amount, 
+                martingale_multiplier, martingale_enabled, current_time or datetime.now())
+    
+    def add_account(self, worker_name: str, ssid: str, is_demo: bool, enabled: bool = True, 
+                   balance: float = 0.00, base_amount: float = 1.00, martingale_multiplier: float = 2.00, 
+                   martingale_enabled: bool = True) -> bool:
+        """Add or update a PocketOption account"""
+        try:
+            params = self._account_params(worker_name, ssid, is_demo, enabled, balance, base_amount,
+                                          martingale_multiplier, martingale_enabled)
+            self._execute_query(self._account_upsert_query(), params)
             
             self.logger.info(f"Account added/updated: {worker_name} (Demo: {is_demo}, Enabled: {enabled}, "
                             f"Base: ${base_amount}, Multiplier: {martingale_multiplier}x, Martingale: {martingale_enabled})")
@@ -555,6 +601,44 @@ class DatabaseManager:
             self.logger.error(f"Failed to add account {worker_name}: {e}")
             return False
     
+    def add_accounts_bulk(self, rows: List[Dict]) -> bool:
+        """Add or update several accounts in one executemany and a single commit
+        
+        Args:
+            rows: List of dictionaries with the keyword arguments of add_account
+        """
+        if not rows:
+            return True
+        
+        current_time = datetime.now()
+        params = [self._account_params(current_time=current_time, **row) for row in rows]
+        cursor = None
+        try:
+            if self.db_type == "mysql":
+                # autocommit is on for MySQL, so open an explicit transaction for the batch
+                self.connection.start_transaction()
+                cursor = self.connection.cursor(buffered=True)
+            else:
+                cursor = self.connection.cursor()
+            cursor.executemany(self._account_upsert_query(), params)
+            self.connection.commit()
+            
+            self.logger.info(f"Accounts added/updated in bulk: {', '.join(row['worker_name'] for row in rows)}")
+            return True
+        except Exception as e:
+            try:
+                self.connection.rollback()
+            except Exception:
+                pass
+            self.logger.error(f"Failed to bulk add {len(rows)} accounts: {e}")
+            return False
+        finally:
+            if cursor:
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+    
     def update_account_balance(self, worker_name: str, balance: float) -> bool:
         """Update account balance"""
         try:
@@ -1314,28 +1398,26 @@ class DatabaseManager:
         try:
             self.logger.info("Populating database with initial account configurations...")
             
+            rows = []
             for config in accounts_config:
                 worker_name = config.get('name')
                 ssid = config.get('ssid')
-                is_demo = config.get('demo', True)
-                enabled = config.get('enabled', True)
                 
                 if not worker_name or not ssid:
                     self.logger.warning(f"Skipping invalid account config: {config}")
                     continue
                 
-                success = self.add_account(
-                    worker_name=worker_name,
-                    ssid=ssid,
-                    is_demo=is_demo,
-                    enabled=enabled,
-                    balance=0.00
-                )
-                
-                if success:
-                    self.logger.info(f"Successfully added/updated account: {worker_name}")
-                else:
-                    self.logger.error(f"Failed to add account: {worker_name}")
+                rows.append({
+                    'worker_name': worker_name,
+                    'ssid': ssid,
+                    'is_demo': config.get('demo', True),
+                    'enabled': config.get('enabled', True),
+                    'balance': 0.00
+                })
+            
+            # All accounts go in through one executemany and a single commit
+            if not self.add_accounts_bulk(rows):
+                self.logger.error(f"Failed to add accounts: {', '.join(row['worker_name'] for row in rows)}")
             
             self.logger.info("Finished populating initial account configurations")
             return True
@@ -4,7 +4,19 @@ import os # Import the os module
 import time # Import the time module
 import re
 import threading
-from telethon import TelegramClient, events
+from collections import deque
+from functools import lru_cache
+from signal_text import (
+    POCKET_DIRECTION_SYMBOLS as _POCKET_DIRECTION_SYMBOLS,
+    TWO_FACTOR_HINT_RE as _TWO_FACTOR_HINT_RE,
+    normalize_pair as _compute_normalized_pair,
+    scan_pocket_signal as _scan_pocket_signal,
+)
+try:
+    # Linear-time engine for the multi-line signal patterns when google-re2 is installed
+    import re2 as _signal_re
+except ImportError:
+    _signal_re = re
 from db.database_manager import DatabaseManager
 import db.database_config as db_config
 
@@ -46,6 +58,8 @@ DEFAULT_EXPIRATION_SECONDS = 10
 _martingale_enabled = True  # Enable/disable Martingale system
 _martingale_multiplier = 2.5  # Will be updated from bot.py
 _account_martingale_states = {}  # Per-account Martingale states
+_MG_POW_CACHE_SIZE = 32  # Loss streaks covered by the precomputed amount table
+_MART_LEVELS = {}  # (base_amount, multiplier) -> amount table, shared by accounts with equal settings
 _pending_trade_results = {}  # Track trades waiting for results
 _pending_trade_data = {}  # Track trade data before saving to database with real trade ID
 _trade_sequence_number = 0  # To track trade order for multiple concurrent trades
@@ -65,6 +79,9 @@ _telethon_listeners_started_successfully = []
 # Lock to serialize console input for Telethon authorization
 _input_lock = threading.Lock()
 
+# Guards the per-account Martingale state against concurrent result handling
+_mg_lock = threading.RLock()
+
 
 def _log(message, level="INFO"):
     """Log to the general logger function or fall back to print"""
@@ -105,7 +122,7 @@ def _initialize_database():
             _account_martingale_states[worker_name] = {
                 'consecutive_losses': consecutive_losses,
                 'last_trade_id': None,
-                'martingale_queue': martingale_queue
+                'martingale_queue': deque(martingale_queue)
             }
             _active_trades_per_account[worker_name] = None
             
@@ -133,16 +150,11 @@ def _get_account_settings(worker_name):
                     'martingale_enabled': state['martingale_enabled']
                 }
         
-        # Fallback: Try to get from database directly
+        # Fallback: fresh single-row read, so settings changed from another process (manage_accounts_enhanced.py) apply
         if _database_manager:
-            accounts = _database_manager.get_all_accounts()
-            for account in accounts:
-                if account['worker_name'] == worker_name:
-                    return {
-                        'base_amount': float(account['base_amount']),  # Convert Decimal to float
-                        'martingale_multiplier': float(account['martingale_multiplier']),  # Convert Decimal to float
-                        'martingale_enabled': account['martingale_enabled']
-                    }
+            settings = _database_manager.get_account_martingale_settings(worker_name)
+            if settings:
+                return settings
         
         # Last resort: Use global defaults (but this should rarely happen)
         _log(f"Using global defaults for account {worker_name} - consider running initialize_martingale_system_from_database()", "WARNING")
@@ -239,6 +251,14 @@ def _update_martingale_settings(martingale_multiplier, enabled=True):
     status = "ENABLED" if enabled else "DISABLED"
     _log(f"Martingale system {status} with multiplier: {_martingale_multiplier}", "INFO")
 
+def _mart_levels(base_amount, multiplier):
+    """Amount table for one (base, multiplier) pair: entry k is the stake after k straight losses"""
+    levels = _MART_LEVELS.get((base_amount, multiplier))
+    if levels is None:
+        levels = [base_amount] + [round(base_amount * (multiplier ** k), 2) for k in range(1, _MG_POW_CACHE_SIZE)]
+        _MART_LEVELS[(base_amount, multiplier)] = levels
+    return levels
+
 def _calculate_next_martingale_amount(worker_name, consecutive_losses=None):
     """Calculate the next trade amount based on account-specific consecutive losses and settings"""
     # Get account-specific settings
@@ -254,6 +274,8 @@ def _calculate_next_martingale_amount(worker_name, consecutive_losses=None):
     
     if consecutive_losses == 0:
         return base_amount
+    elif consecutive_losses < _MG_POW_CACHE_SIZE:
+        return _mart_levels(base_amount, multiplier)[consecutive_losses]
     else:
         amount = base_amount * (multiplier ** consecutive_losses)
         return round(amount, 2)
@@ -273,14 +295,14 @@ def _get_trade_amount_for_new_signal(worker_name):
         _account_martingale_states[worker_name] = {
             'consecutive_losses': 0,
             'last_trade_id': None,
-            'martingale_queue': []
+            'martingale_queue': deque()
         }
     
     account_state = _account_martingale_states[worker_name]
     
     # Check if there are pre-calculated amounts waiting from previous losses
     if account_state['martingale_queue']:
-        amount = account_state['martingale_queue'].pop(0)  # Take the first queued amount (FIFO)
+        amount = account_state['martingale_queue'].popleft()  # Take the first queued amount (FIFO)
         _log(f"[{worker_name}] Using queued Martingale amount: ${amount} (queue remaining: {len(account_state['martingale_queue'])})", "INFO")
     else:
         # No queued amounts, calculate based on current consecutive losses
@@ -289,8 +311,65 @@ def _get_trade_amount_for_new_signal(worker_name):
     
     return amount
 
+def _track_pending_trade(trade_id, symbol, amount, direction=None, worker_name=None):
+    """
+    Record a placed trade as awaiting its result. _pending_trade_results is the only
+    bookkeeping for open trades; the active count is always len(_pending_trade_results).
+    """
+    _pending_trade_results[trade_id] = {
+        'timestamp': time.time(),
+        'amount': amount,
+        'symbol': symbol,
+        'direction': direction,
+        'worker_name': worker_name
+    }
+
 def _handle_trade_result(trade_id, symbol, result, profit_loss=None, worker_name=None):
     """Handle trade result for per-account Martingale system"""
+    with _mg_lock:
+        _handle_trade_result_locked(trade_id, symbol, result, profit_loss, worker_name)
+
+def _handle_trade_results_batch(results):
+    """
+    Apply several trade results under a single lock acquisition.
+    results: iterable of (trade_id, symbol, result, profit_loss[, worker_name]) tuples
+    """
+    count = 0
+    with _mg_lock:
+        for entry in results:
+            _handle_trade_result_locked(*entry)
+            count += 1
+    _log(f"Processed batch of {count} trade results", "INFO")
+    return count
+
+def reset_for_testing():
+    """Clear all per-account Martingale and trade-tracking state under _mg_lock (test helper)"""
+    global _current_active_trade
+    with _mg_lock:
+        _account_martingale_states.clear()
+        _pending_trade_results.clear()
+        _pending_trade_data.clear()
+        _active_trades_per_account.clear()
+        _current_active_trade = None
+
+def _new_account_state(base_amount, martingale_multiplier, martingale_enabled):
+    """Clean per-account Martingale state carrying the account's settings"""
+    return {
+        'consecutive_losses': 0,
+        'last_trade_id': None,
+        'martingale_queue': deque(),
+        'base_amount': base_amount,
+        'martingale_multiplier': martingale_multiplier,
+        'martingale_enabled': martingale_enabled
+    }
+
+def seed_account_for_testing(worker_name, base_amount, martingale_multiplier, martingale_enabled=True):
+    """Give worker_name a clean Martingale state with these settings under _mg_lock (test helper)"""
+    with _mg_lock:
+        _account_martingale_states[worker_name] = _new_account_state(base_amount, martingale_multiplier, martingale_enabled)
+
+def _handle_trade_result_locked(trade_id, symbol, result, profit_loss=None, worker_name=None):
+    """Body of _handle_trade_result; caller must hold _mg_lock"""
     global _current_active_trade
     
     if worker_name is None:
@@ -316,7 +395,7 @@ def _handle_trade_result(trade_id, symbol, result, profit_loss=None, worker_name
         _account_martingale_states[worker_name] = {
             'consecutive_losses': 0,
             'last_trade_id': None,
-            'martingale_queue': []
+            'martingale_queue': deque()
         }
     
     account_state = _account_martingale_states[worker_name]
@@ -399,7 +478,7 @@ def _save_account_martingale_state(worker_name):
         success = _database_manager.save_account_martingale_state(
             account_name=worker_name,
             consecutive_losses=consecutive_losses,
-            martingale_queue=martingale_queue
+            martingale_queue=list(martingale_queue)
         )
         
         if success:
@@ -416,26 +495,97 @@ def _monitor_trade_results():
     # For now, it's a placeholder for future enhancement
     pass
 
+# Signal parsing patterns, compiled once at import instead of on every message
+_FIRST_PART_RE = re.compile(r"([\w\/]+(?:\s+OTC)?)\s+M(\d+)", re.IGNORECASE)
+_SECOND_PART_UP_RE = re.compile(r"⬆️\s*UP\s*⬆️", re.IGNORECASE)
+_SECOND_PART_DOWN_RE = re.compile(r"⬇️\s*DOWN\s*⬇️", re.IGNORECASE)
+_SECOND_PART_UP_OLD_RE = re.compile(r"🔼\s*UP\s*🔼", re.IGNORECASE)
+_SECOND_PART_DOWN_OLD_RE = re.compile(r"🔽\s*DOWN\s*🔽", re.IGNORECASE)
+
+# The two multi-line formats set their flags inline, (?is) = IGNORECASE | DOTALL,
+# so the same pattern text compiles under both re and re2
+
+# Python's Unicode \w, \s and \d spelled out for re2, whose shorthand classes are ASCII-only
+# (\s here is exactly the str.isspace() set, NBSP included)
+_RE2_UNICODE_CLASSES = {
+    r'\w': r'\pL\pN_',
+    r'\s': r'\t\n\x{0b}\f\r\x{1c}-\x{20}\x{85}\x{a0}\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}',
+    r'\d': r'\p{Nd}',
+}
+
+def _re2_unicode_pattern(pattern):
+    """Rewrite \\w, \\s and \\d in pattern as the explicit Unicode classes above, inside or outside [...]"""
+    out = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == '\\':
+            escape = pattern[i:i + 2]
+            unicode_class = _RE2_UNICODE_CLASSES.get(escape)
+            if unicode_class is None:
+                out.append(escape)
+            else:
+                out.append(unicode_class if in_class else '[' + unicode_class + ']')
+            i += 2
+            continue
+        if ch == '[':
+            in_class = True
+        elif ch == ']':
+            in_class = False
+        out.append(ch)
+        i += 1
+    return ''.join(out)
+
+def _compile_signal_pattern(pattern, engine=None):
+    """Compile a multi-line signal pattern with re2 when installed, else re, keeping re's Unicode classes under both"""
+    engine = engine or _signal_re
+    if engine is re:
+        return re.compile(pattern)
+    return engine.compile(_re2_unicode_pattern(pattern))
+
+# Pocket Option Official Signal Bot format
+_POCKET_SIGNAL_PATTERN = (
+    r"(?is)SIGNAL\s*([⬇⬆↓↑])\s*\n"  # Signal direction
+    r".*?"  # Any content in between
+    r"Asset:\s*([#]?[\w-]+(?:_\w+)?)\s*\n"  # Asset/Pair name (with optional # prefix, hyphens, and _otc/_live suffix)
+    r".*?"  # Any content in between  
+    r"Expiration:\s*M(\d+)"  # Expiration in minutes
+)
+_POCKET_SIGNAL_RE = _compile_signal_pattern(_POCKET_SIGNAL_PATTERN)
+
+# TWSBINARY format
+_TWSBINARY_SIGNAL_PATTERN = (
+    r"(?is)(?:🔴|🟢)\s*(PUT|CALL)\s*Signal\s*on\s*([\w\/-]+(?:m)?)\s*\n"  # Action and Pair (e.g., USDCADm)
+    r".*?"  # Non-greedy match for any lines in between (like Price, Attempt)
+    r"Expiration:\s*(\d+)\s*(minute|minutes|second|seconds|hour|hours)"  # Expiration value and unit
+)
+_TWSBINARY_SIGNAL_RE = _compile_signal_pattern(_TWSBINARY_SIGNAL_PATTERN)
+
+# Generic "PAIR ACTION [AMT n] [EXP n(s|m|h)]" fallback format
+_FALLBACK_SIGNAL_RE = re.compile(
+    r"([\w#/-]+(?:_otc)?)\s+"  # Pair (e.g., EURUSD_otc, #AAPL, BTC/USD)
+    r"(CALL|PUT|BUY|SELL)\s+"   # Action
+    r"(?:AMT\s*(\d+)\s+)?"      # Optional Amount (e.g., AMT 100)
+    r"(?:EXP\s*(\d+)([smh]))?", # Optional Expiration (e.g., EXP 60s, EXP 5m)
+    re.IGNORECASE
+)
+
+# Raw pair text -> normalized pair; the asset universe is small, so this stays tiny
+_PAIR_NORM_CACHE = {}
+_PAIR_NORM_CACHE_MAX = 1024
+
 def _normalize_pair_for_new_format(raw_pair_text):
     """
     Normalizes pair string from formats like "BHD/CNY OTC", "EURUSD", "AUD/CAD_otc".
     Output: "BHDCNY_otc", "EURUSD", "AUDCAD_otc" (slash removed, _otc is lowercase, base is uppercase)
     """
-    normalized_pair = raw_pair_text.strip() # Keep original case for a moment for OTC checks
-
-    # Standardize OTC suffix to _otc and ensure base is uppercase and slashes removed
-    if normalized_pair.upper().endswith(" OTC"): # Handles "BHD/CNY OTC"
-        base = normalized_pair[:-4].strip()
-        normalized_pair = base.upper().replace("/", "") + "_otc"
-    elif "_otc" in normalized_pair.lower(): # Handles "AUD/CAD_otc" or "EURUSD_otc" or "EURUSD_OTC"
-        # Split by _otc (case-insensitive), take the first part, uppercase, remove slashes, add _otc
-        parts = re.split(r'_otc', normalized_pair, flags=re.IGNORECASE)
-        normalized_pair = parts[0].upper().replace("/", "") + "_otc"
-    else: # Handles "EURUSD" or "USD/JPY"
-        normalized_pair = normalized_pair.upper().replace("/", "")
-        
-    # Ensure any remaining _OTC (if somehow missed) becomes _otc - defensive
-    normalized_pair = normalized_pair.replace("_OTC", "_otc")
+    normalized_pair = _PAIR_NORM_CACHE.get(raw_pair_text)
+    if normalized_pair is None:
+        normalized_pair = _compute_normalized_pair(raw_pair_text)
+        if len(_PAIR_NORM_CACHE) >= _PAIR_NORM_CACHE_MAX:
+            _PAIR_NORM_CACHE.clear()
+        _PAIR_NORM_CACHE[raw_pair_text] = normalized_pair
     return normalized_pair
 
 def _parse_first_part_signal(message_text):
@@ -445,7 +595,7 @@ def _parse_first_part_signal(message_text):
     """
     # Expects message like "BHD/CNY OTC M1" or "EURUSD M5"
     # Regex matches the pair part (including optional OTC) and the M<digits> timeframe
-    match = re.fullmatch(r"([\w\/]+(?:\s+OTC)?)\s+M(\d+)", message_text.strip(), re.IGNORECASE)
+    match = _FIRST_PART_RE.fullmatch(message_text.strip())
     if match:
         raw_pair_text = match.group(1)
         timeframe_minutes = int(match.group(2))
@@ -463,14 +613,14 @@ def _parse_second_part_signal(message_text):
     """
     txt = message_text.strip()
     # Check for new arrow format first as it was provided in the log
-    if re.fullmatch(r"⬆️\s*UP\s*⬆️", txt, re.IGNORECASE):
+    if _SECOND_PART_UP_RE.fullmatch(txt):
         return 'call'
-    if re.fullmatch(r"⬇️\s*DOWN\s*⬇️", txt, re.IGNORECASE): # Assuming a similar down arrow
+    if _SECOND_PART_DOWN_RE.fullmatch(txt): # Assuming a similar down arrow
         return 'put'
     # Fallback to old arrow format if needed, or remove if only new format is used
-    if re.fullmatch(r"🔼\s*UP\s*🔼", txt, re.IGNORECASE): # Original UP pattern
+    if _SECOND_PART_UP_OLD_RE.fullmatch(txt): # Original UP pattern
         return 'call'
-    if re.fullmatch(r"🔽\s*DOWN\s*🔽", txt, re.IGNORECASE): # Original DOWN pattern
+    if _SECOND_PART_DOWN_OLD_RE.fullmatch(txt): # Original DOWN pattern
         return 'put'
     return None
 
@@ -486,6 +636,24 @@ def parse_signal_from_message(message_text):
     """
     _log(f"Attempting to parse message: \"{message_text}\"", "DEBUG")
 
+    # Repeated message bodies are answered from the cache; a fresh dict is built each
+    # call so callers can't corrupt the cached entry
+    parsed = _parse_signal_fields(message_text)
+    if parsed is None:
+        return None
+    label, pair, action, amount, expiration = parsed
+    if amount is None:
+        amount = DEFAULT_TRADE_AMOUNT
+    _log(f"{label} parsed: Pair={pair}, Action={action}, Amount=${amount}, Expiration={expiration}s", "INFO")
+    return {'pair': pair, 'action': action, 'amount': amount, 'expiration': expiration}
+
+@lru_cache(maxsize=512)
+def _parse_signal_fields(message_text):
+    """
+    Cached pattern matching behind parse_signal_from_message.
+    Returns (log_label, pair, action, amount, expiration_seconds) or None; amount is None
+    when the signal doesn't carry one, so DEFAULT_TRADE_AMOUNT is read at call time.
+    """
     # --- Parsing Logic for Pocket Option Official Signal Bot format ---
     # Example:
     # SIGNAL ⬇
@@ -494,21 +662,18 @@ def parse_signal_from_message(message_text):
     # Accuracy: 80%
     # Expiration: M5
 
-    pocket_signal_pattern = re.compile(
-        r"SIGNAL\s*([⬇⬆↓↑])\s*\n"  # Signal direction
-        r".*?"  # Any content in between
-        r"Asset:\s*([#]?[\w-]+(?:_\w+)?)\s*\n"  # Asset/Pair name (with optional # prefix, hyphens, and _otc/_live suffix)
-        r".*?"  # Any content in between  
-        r"Expiration:\s*M(\d+)",  # Expiration in minutes
-        re.IGNORECASE | re.DOTALL
-    )
-
-    match = pocket_signal_pattern.search(message_text)
+    # Both Pocket paths need one of the arrow characters; one C-level scan rules them out
+    fields = None
+    if not _POCKET_DIRECTION_SYMBOLS.isdisjoint(message_text):
+        # Plain line scan for the usual layout; the regex covers anything less regular
+        fields = _scan_pocket_signal(message_text)
+        if fields is None:
+            match = _POCKET_SIGNAL_RE.search(message_text)
+            if match:
+                fields = (match.group(1), match.group(2).strip(), int(match.group(3)))
     
-    if match:
-        direction_symbol = match.group(1)
-        asset_name = match.group(2).strip()
-        expiration_minutes = int(match.group(3))
+    if fields:
+        direction_symbol, asset_name, expiration_minutes = fields
         
         # Determine action based on direction symbol
         if direction_symbol in ['⬇', '↓']:
@@ -523,10 +688,8 @@ def parse_signal_from_message(message_text):
         pair_str = _normalize_pair_for_new_format(asset_name)
         
         expiration_seconds = expiration_minutes * 60
-        amount = DEFAULT_TRADE_AMOUNT
 
-        _log(f"Pocket Signal parsed: Pair={pair_str}, Action={action}, Amount=${amount}, Expiration={expiration_seconds}s", "INFO")
-        return {'pair': pair_str, 'action': action, 'amount': amount, 'expiration': expiration_seconds}
+        return ("Pocket Signal", pair_str, action, None, expiration_seconds)
 
     # --- Parsing Logic for TWSBINARY format ---
     # Example:
@@ -535,17 +698,13 @@ def parse_signal_from_message(message_text):
     # Attempt: 1
     # Expiration: 3 minutes
 
-    # Regex to capture Action (PUT/CALL), Pair, and Expiration
+    # _TWSBINARY_SIGNAL_RE captures Action (PUT/CALL), Pair, and Expiration
     # It looks for lines starting with "🔴 PUT Signal on", "🟢 CALL Signal on", or similar
     # and a line starting with "Expiration:"
-    signal_pattern = re.compile(
-        r"(?:🔴|🟢)\s*(PUT|CALL)\s*Signal\s*on\s*([\w\/-]+(?:m)?)\s*\n"  # Action and Pair (e.g., USDCADm)
-        r".*?"  # Non-greedy match for any lines in between (like Price, Attempt)
-        r"Expiration:\s*(\d+)\s*(minute|minutes|second|seconds|hour|hours)",  # Expiration value and unit
-        re.IGNORECASE | re.DOTALL  # DOTALL allows . to match newlines
-    )
-
-    match = signal_pattern.search(message_text)
+    # (skipped outright when neither marker emoji is present)
+    match = None
+    if '🔴' in message_text or '🟢' in message_text:
+        match = _TWSBINARY_SIGNAL_RE.search(message_text)
 
     if match:
         action_str = match.group(1).upper()
@@ -557,20 +716,8 @@ def parse_signal_from_message(message_text):
             if not temp_pair.upper().endswith("_OTCM"): # Avoid stripping M from a name like "XYZ_OTCM"
                  temp_pair = temp_pair[:-1] # e.g., "USDCADm" -> "USDCAD"
 
-        # 2. Normalize the processed pair string (e.g., "USDCAD", "EUR/USD_otc")
-        #    This logic mirrors _normalize_pair_for_new_format for consistency.
-        normalized_intermediate_pair = temp_pair 
-        if normalized_intermediate_pair.upper().endswith(" OTC"): # Unlikely for TWSBINARY regex
-            base = normalized_intermediate_pair[:-4].strip()
-            pair_str = base.upper().replace("/", "") + "_otc"
-        elif "_otc" in normalized_intermediate_pair.lower(): # Handles "EUR/USD_otc"
-            parts = re.split(r'_otc', normalized_intermediate_pair, flags=re.IGNORECASE)
-            pair_str = parts[0].upper().replace("/", "") + "_otc" # e.g. "EURUSD_otc"
-        else: # Handles "USDCAD" or "EUR/USD" (if _otc was not part of it)
-            pair_str = normalized_intermediate_pair.upper().replace("/", "") # e.g. "USDCAD", "EURUSD"
-        
-        # Ensure any remaining _OTC becomes _otc - defensive
-        pair_str = pair_str.replace("_OTC", "_otc")
+        # 2. Normalize the processed pair string (e.g., "USDCAD", "EUR/USD_otc" -> "EURUSD_otc")
+        pair_str = _normalize_pair_for_new_format(temp_pair)
 
         exp_value = int(match.group(3))
         exp_unit = match.group(4).lower()
@@ -581,21 +728,12 @@ def parse_signal_from_message(message_text):
         if 'minute' in exp_unit: expiration_seconds = exp_value * 60
         elif 'second' in exp_unit: expiration_seconds = exp_value
         elif 'hour' in exp_unit: expiration_seconds = exp_value * 3600
-        amount = DEFAULT_TRADE_AMOUNT
 
-        _log(f"Signal parsed: Pair={pair_str}, Action={action}, Amount=${amount}, Expiration={expiration_seconds}s", "INFO")
-        return {'pair': pair_str, 'action': action, 'amount': amount, 'expiration': expiration_seconds}
+        return ("Signal", pair_str, action, None, expiration_seconds)
 
     # --- Fallback to previous Example Parsing Logic (Pattern 1) ---
     # This can be kept if you expect other signal formats as well.
-    pattern1_fallback = re.compile(
-        r"([\w#/-]+(?:_otc)?)\s+"  # Pair (e.g., EURUSD_otc, #AAPL, BTC/USD)
-        r"(CALL|PUT|BUY|SELL)\s+"   # Action
-        r"(?:AMT\s*(\d+)\s+)?"      # Optional Amount (e.g., AMT 100)
-        r"(?:EXP\s*(\d+)([smh]))?", # Optional Expiration (e.g., EXP 60s, EXP 5m)
-        re.IGNORECASE
-    )
-    match_fallback = pattern1_fallback.match(message_text.strip()) # Use .match() and .strip()
+    match_fallback = _FALLBACK_SIGNAL_RE.match(message_text.strip()) # Use .match() and .strip()
     if match_fallback:
         pair_raw_fallback = match_fallback.group(1).strip()
         action_str = match_fallback.group(2).upper()
@@ -606,18 +744,12 @@ def parse_signal_from_message(message_text):
         # Normalize pair for fallback pattern
         if pair_raw_fallback.startswith("#"): # Special case for symbols like #AAPL
             pair = pair_raw_fallback.upper() 
-        elif pair_raw_fallback.upper().endswith(" OTC"): # Unlikely for this regex pattern
-            base_fallback = pair_raw_fallback[:-4].strip()
-            pair = base_fallback.upper().replace("/", "") + "_otc"
-        elif "_otc" in pair_raw_fallback.lower():
-            parts_fallback = re.split(r'_otc', pair_raw_fallback, flags=re.IGNORECASE)
-            pair = parts_fallback[0].upper().replace("/", "") + "_otc"
-        else: # Handles "BTC/USD", "EURUSD"
-            pair = pair_raw_fallback.upper().replace("/", "")
+        else: # Handles "BTC/USD", "EURUSD", "EURUSD_otc"
+            pair = _normalize_pair_for_new_format(pair_raw_fallback)
 
         action_fallback = 'call' if action_str in ['CALL', 'BUY'] else 'put'
         
-        amount_fallback = int(amount_str) if amount_str else DEFAULT_TRADE_AMOUNT
+        amount_fallback = int(amount_str) if amount_str else None
         
         expiration_fallback = DEFAULT_EXPIRATION_SECONDS
         if exp_val_str and exp_unit:
@@ -632,8 +764,7 @@ def parse_signal_from_message(message_text):
         # Ensure any remaining _OTC becomes _otc - defensive
         pair = pair.replace("_OTC", "_otc")
         
-        _log(f"Signal parsed: Pair={pair}, Action={action_fallback}, Amount=${amount_fallback}, Expiration={expiration_fallback}s", "INFO")
-        return {'pair': pair, 'action': action_fallback, 'amount': amount_fallback, 'expiration': expiration_fallback}
+        return ("Signal", pair, action_fallback, amount_fallback, expiration_fallback)
 
     #_log(f"No parsable signal found in message.", "DEBUG")
     return None
@@ -848,13 +979,8 @@ async def new_message_handler(event):
                 _active_trades_per_account[worker_name] = True
                 
                 # Track this trade for Martingale result monitoring
-                _pending_trade_results[trade_tracking_id] = {
-                    'timestamp': time.time(),
-                    'amount': martingale_amount,
-                    'symbol': signal_data_for_trade['pair'],
-                    'direction': signal_data_for_trade['action'],
-                    'worker_name': worker_name
-                }
+                _track_pending_trade(trade_tracking_id, signal_data_for_trade['pair'], martingale_amount,
+                                     direction=signal_data_for_trade['action'], worker_name=worker_name)
                 
                 # Store trade details for when we get the real PocketOption trade ID
                 account_settings = _get_account_settings(worker_name)
@@ -916,13 +1042,8 @@ async def new_message_handler(event):
         _active_trades_per_account[worker_name] = True
         
         # Track this trade for Martingale result monitoring
-        _pending_trade_results[trade_tracking_id] = {
-            'timestamp': time.time(),
-            'amount': martingale_amount,
-            'symbol': original_format_signal_data['pair'],
-            'direction': original_format_signal_data['action'],
-            'worker_name': worker_name
-        }
+        _track_pending_trade(trade_tracking_id, original_format_signal_data['pair'], martingale_amount,
+                             direction=original_format_signal_data['action'], worker_name=worker_name)
         
         # Store trade details for when we get the real PocketOption trade ID
         account_settings = _get_account_settings(worker_name)
@@ -976,11 +1097,11 @@ async def _run_telethon_listener_loop(account_config, success_flags_list, listen
 
     # Construct session path
     session_folder = "telegram_sessions"
-    if not os.path.exists(session_folder):
-        os.makedirs(session_folder)
-        _log(f"{log_prefix} Created directory: {session_folder}", "INFO")
+    os.makedirs(session_folder, exist_ok=True)
     full_session_path = os.path.join(session_folder, session_name)
 
+    # Deferred so the signal parser and Martingale helpers import without loading Telethon
+    from telethon import TelegramClient, events
     client = TelegramClient(full_session_path, api_id, api_hash)
 
     try: # Outer try for the whole client lifecycle
@@ -1014,7 +1135,7 @@ async def _run_telethon_listener_loop(account_config, success_flags_list, listen
                         _log(f"{log_prefix} Sign-in error for {session_name}: {e}. If 2FA, provide password. Try code again.", "ERROR")
                         
                         # Enhanced 2FA detection - check for multiple possible error patterns
-                        if any(keyword in error_str for keyword in ['password', 'two-factor', '2fa', 'two factor', 'cloud password']):
+                        if _TWO_FACTOR_HINT_RE.search(error_str):
                              try:
                                 password = input(f"Telethon ({session_name}): 2FA Password for {phone_number}: ")
                                 await client.sign_in(password=password)
@@ -1182,6 +1303,21 @@ def initialize_martingale_system(martingale_multiplier, enabled=True):
     status = "ENABLED" if enabled else "DISABLED"
     _log(f"Martingale system initialized: {status} with multiplier: {martingale_multiplier}", "INFO")
 
+def configure_martingale(enabled=True, multiplier=None, default_amount=None):
+    """Set the global Martingale defaults used by accounts without database settings"""
+    global DEFAULT_TRADE_AMOUNT
+    if multiplier is None:
+        multiplier = _martingale_multiplier
+    if default_amount is None:
+        default_amount = DEFAULT_TRADE_AMOUNT
+    
+    # Fast path: nothing to do when the configuration already matches
+    if (_martingale_enabled, _martingale_multiplier, DEFAULT_TRADE_AMOUNT) == (enabled, multiplier, default_amount):
+        return
+    
+    DEFAULT_TRADE_AMOUNT = default_amount
+    _update_martingale_settings(multiplier, enabled)
+
 def initialize_martingale_system_from_database():
     """Initialize the Martingale system using per-account settings from database"""
     global _database_manager
@@ -1202,13 +1338,7 @@ def initialize_martingale_system_from_database():
             
             # Initialize account state in our tracking system
             if account_name not in _account_martingale_states:
-                _account_martingale_states[account_name] = {
-                    'consecutive_losses': 0,
-                    'martingale_queue': [],
-                    'base_amount': base_amount,
-                    'martingale_multiplier': martingale_multiplier,
-                    'martingale_enabled': martingale_enabled
-                }
+                _account_martingale_states[account_name] = _new_account_state(base_amount, martingale_multiplier, martingale_enabled)
             else:
                 # Update existing state with current database values
                 _account_martingale_states[account_name]['base_amount'] = base_amount
@@ -1259,7 +1389,7 @@ def get_current_martingale_status():
     
     if primary_account in _account_martingale_states:
         primary_consecutive_losses = _account_martingale_states[primary_account]['consecutive_losses']
-        primary_queue = _account_martingale_states[primary_account]['martingale_queue'].copy()
+        primary_queue = list(_account_martingale_states[primary_account]['martingale_queue'])
     
     return {
         'martingale_enabled': _martingale_enabled,
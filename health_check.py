@@ -17,7 +17,8 @@ from email.mime.multipart import MimeMultipart
 
 # Add the bot directory to Python path
 BOT_DIR = os.path.dirname(os.path.abspath(__file__))
-sys.path.append(BOT_DIR)
+if BOT_DIR not in sys.path:
+    sys.path.insert(0, BOT_DIR)
 
 try:
     from db.database_manager import DatabaseManager
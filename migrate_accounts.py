@@ -38,26 +38,27 @@ def migrate_accounts():
     
     print(f"Migrating {len(hardcoded_accounts)} accounts to database...")
     
-    success_count = 0
+    rows = []
     for account in hardcoded_accounts:
         print(f"  Adding account: {account['name']} (Demo: {account['demo']}, Enabled: {account['enabled']})")
-        
-        success = db.add_account(
-            worker_name=account['name'],
-            ssid=account['ssid'],
-            is_demo=account['demo'],
-            enabled=account['enabled'],
-            balance=0.00,
-            base_amount=1.00,  # Default base amount
-            martingale_multiplier=2.5,  # Default multiplier 
-            martingale_enabled=True  # Enable Martingale by default
-        )
-        
-        if success:
-            success_count += 1
-            print(f"    ✓ Success")
-        else:
-            print(f"    ✗ Failed")
+        rows.append({
+            'worker_name': account['name'],
+            'ssid': account['ssid'],
+            'is_demo': account['demo'],
+            'enabled': account['enabled'],
+            'balance': 0.00,
+            'base_amount': 1.00,  # Default base amount
+            'martingale_multiplier': 2.5,  # Default multiplier 
+            'martingale_enabled': True  # Enable Martingale by default
+        })
+    
+    # Write every account in one batch (single commit) instead of one INSERT per account
+    if db.add_accounts_bulk(rows):
+        success_count = len(rows)
+        print(f"    ✓ Success")
+    else:
+        success_count = 0
+        print(f"    ✗ Failed")
     
     print(f"\nMigration completed: {success_count}/{len(hardcoded_accounts)} accounts migrated successfully")
     
@@ -1,21 +1,28 @@
 import time, logging, math, asyncio, json
 from datetime import datetime
-import talib.abstract as ta
-import numpy as np
-import pandas as pd
-from finta import TA
-import freqtrade.vendor.qtpylib.indicators as qtpylib
 from BinaryOptionsToolsV2.pocketoption import PocketOptionAsync
 
 start = time.perf_counter()
 
 min_payout = 85
+payout_ttl = 30  # seconds; payouts change slowly, skip refetching on every tick
+
+_payout_cache = (0.0, None)  # (fetched_at, full_payout)
 
 api = PocketOptionAsync(demo)
 
+async def fetch_payout():
+    global _payout_cache
+    fetched_at, full_payout = _payout_cache
+    now = time.monotonic()
+    if full_payout is None or now - fetched_at >= payout_ttl:
+        full_payout = await api.payout()
+        _payout_cache = (now, full_payout)
+    return full_payout
+
 async def get_payout(dat):
     data = dat
-    full_payout = await api.payout()
+    full_payout = await fetch_payout()
     for pair in full_payout:
         if full_payout[pair] > min_payout:
             p = {}
@@ -1,5 +1,6 @@
 import time
-from pocketoptionapi.stable_api import PocketOption
+import random
+import threading
 import pocketoptionapi.global_value as global_value
 
 # --- Configuration ---
@@ -8,11 +9,30 @@ ssid = """42["auth",{"session":"bpajv9apd668u8qkcdp4i34vc0","isDemo":1,"uid":104
 demo = True
 
 _api_instance = None
+_api_instance_lock = threading.Lock()  # serializes creation so concurrent callers share one instance
 _logger_initialized = False
 
+_GREEN, _RESET = "\033[92m", "\033[0m"  # ANSI colours for highlighted log lines
+
+# Short-lived balance cache so back-to-back connection checks don't re-query the client
+_last_known_balance = None
+_last_balance_ts = 0.0
+_BALANCE_TTL = 0.5
+
+# Retry policy for creating/connecting the API instance
+_CONNECT_MAX_ATTEMPTS = 5
+_CONNECT_BACKOFF_BASE = 0.5  # seconds
+_CONNECT_BACKOFF_CAP = 60    # seconds
+_CONNECT_JITTER = 0.5        # seconds
+_connect_cancel_event = threading.Event()  # set() to abort a pending retry sleep; cleared when a new retry sequence starts
+
+def _logger_already_initialized(name="PocketConnector"):
+    """No-op stand-in for _ensure_logger_initialized once the logger is set up."""
+    pass
+
 def _ensure_logger_initialized(name="PocketConnector"):
     """Initializes logger if not already done by the main application."""
-    global _logger_initialized
+    global _logger_initialized, _ensure_logger_initialized
     if not _logger_initialized:
         # Attempt to use existing loglevel if set by main app, else default.
         if not hasattr(global_value, 'loglevel'):
@@ -21,7 +41,10 @@ def _ensure_logger_initialized(name="PocketConnector"):
         # and pocketoptionapi.stable_api.PocketOption is instantiated, which sets up logging.
         # This function primarily ensures we can log from here.
         _logger_initialized = True # Ensure this is set before logging
-        global_value.logger(f"[{name}] PocketConnector logger is active.", "DEBUG")
+        if global_value.is_debug():
+            global_value.logger(f"[{name}] PocketConnector logger is active.", "DEBUG")
+    # Later calls resolve the module global to the no-op and skip the check entirely
+    _ensure_logger_initialized = _logger_already_initialized
 
 
 def get_api_instance():
@@ -30,30 +53,94 @@ def get_api_instance():
     The PocketOption constructor itself attempts to connect.
     """
     global _api_instance
+    # Fast path: instance already exists, skip logger setup and creation logic
+    api = _api_instance
+    if api is not None:
+        return api
+
     _ensure_logger_initialized()
 
-    if _api_instance is None:
-        try:
-            global_value.logger("[PocketConnector] Creating new PocketOption API instance...", "INFO")
-            _api_instance = PocketOption(ssid, demo) # ssid and demo are global in this module
-            
-            global_value.logger("[PocketConnector] PocketOption instance created. Attempting explicit connect()...", "INFO")
-            _api_instance.connect() # Crucial step to start the WebSocket connection process
+    with _api_instance_lock:
+        # Double-checked: another thread may have finished creating it while we waited
+        if _api_instance is not None:
+            return _api_instance
 
-            # A short pause to allow the connection thread (started by .connect()) to initialize.
-            # The actual confirmation of connection (global_value.websocket_is_connected becoming True)
-            # will be handled by the check_connection() function, which typically follows this call.
-            time.sleep(1) # Brief pause, check_connection will do the longer wait.
-            
-            global_value.logger("[PocketConnector] connect() called on new instance. Status will be verified by check_connection.", "DEBUG")
+        # Imported here so loading this module (for ssid/demo or check_connection) stays cheap
+        from pocketoptionapi.stable_api import PocketOption
+
+        # A cancel only applies to the sequence it interrupted, so start each one uncancelled.
+        # The lock stays held through the backoff sleeps on purpose: releasing it would let a waiting
+        # caller start a second PocketOption/websocket in parallel. Waiters get this sequence's instance
+        # (or start their own once it gives up), and cancel_connect_retries() cuts the wait short.
+        _connect_cancel_event.clear()
+        last_error = None
+        for attempt in range(_CONNECT_MAX_ATTEMPTS):
+            try:
+                global_value.logger("[PocketConnector] Creating new PocketOption API instance...", "INFO")
+                api = PocketOption(ssid, demo) # ssid and demo are global in this module
+
+                global_value.logger("[PocketConnector] PocketOption instance created. Attempting explicit connect()...", "INFO")
+                api.connect() # Crucial step to start the WebSocket connection process
+
+                # A short pause to allow the connection thread (started by .connect()) to initialize.
+                # Returns as soon as the ws client signals connected, capped at the old 1s pause.
+                # The actual confirmation of connection (global_value.websocket_is_connected becoming True)
+                # will be handled by the check_connection() function, which typically follows this call.
+                global_value.ws_connected_event.wait(1.0) # Brief wait, check_connection will do the longer wait.
+
+                # Publish only once connect() has been issued so the lock-free fast path never sees a half-built instance
+                _api_instance = api
+                global_value.logger("[PocketConnector] connect() called on new instance. Status will be verified by check_connection.", "DEBUG")
+                break
 
-        except Exception as e:
-            # Log the error with more specific context if possible
-            global_value.logger(f"[PocketConnector] Error during PocketOption API instance creation or connect() call: {e}", "CRITICAL")
-            _api_instance = None # Ensure instance is None if there was a critical error here
-            raise
+            except Exception as e:
+                # Log the error with more specific context if possible
+                global_value.logger(f"[PocketConnector] Error during PocketOption API instance creation or connect() call (attempt {attempt + 1}/{_CONNECT_MAX_ATTEMPTS}): {e}", "CRITICAL")
+                _api_instance = None # Ensure instance is None if there was a critical error here
+                last_error = e
+
+                if attempt + 1 >= _CONNECT_MAX_ATTEMPTS:
+                    break
+                # Exponential backoff with jitter so many workers don't reconnect in lockstep
+                delay = min(_CONNECT_BACKOFF_CAP, _CONNECT_BACKOFF_BASE * (2 ** attempt)) + random.random() * _CONNECT_JITTER
+                global_value.logger(f"[PocketConnector] Retrying connection in {delay:.2f}s...", "WARNING")
+                if _connect_cancel_event.wait(delay):
+                    global_value.logger("[PocketConnector] Connection retry cancelled.", "WARNING")
+                    break
+
+        if _api_instance is None:
+            raise last_error
     return _api_instance
 
+def cancel_connect_retries():
+    """Aborts the backoff sleep of the retry sequence in progress inside get_api_instance (e.g. on shutdown)."""
+    _connect_cancel_event.set()
+
+def _cached_get_balance():
+    """
+    Returns the account balance, reusing the last non-None value for _BALANCE_TTL seconds.
+    The cache is dropped whenever the WebSocket is reported disconnected.
+    """
+    global _last_known_balance, _last_balance_ts
+    if not global_value.websocket_is_connected:
+        _last_known_balance = None
+        _last_balance_ts = 0.0
+        return None
+
+    # Deferred read: nothing to ask the client for until the first balance frame is parsed
+    if not global_value.balance_event.is_set():
+        return None
+
+    now = time.monotonic()
+    if _last_known_balance is not None and now - _last_balance_ts < _BALANCE_TTL:
+        return _last_known_balance
+
+    balance_value = _api_instance.get_balance()
+    if balance_value is not None:
+        _last_known_balance = balance_value
+        _last_balance_ts = now
+    return balance_value
+
 def ensure_connected(timeout_seconds=10):
     """
     Ensures an API instance exists and is connected.
@@ -96,15 +183,14 @@ def check_connection(timeout_seconds=10):
     Returns True if fully connected and ready, False otherwise.
     """
     _ensure_logger_initialized()
-    start_time = time.time()
-    global_value.logger(f"[PocketConnector] Verifying connection and API readiness (timeout: {timeout_seconds}s)...", "DEBUG")
+    deadline = time.monotonic() + timeout_seconds
+    if global_value.is_debug():
+        global_value.logger(f"[PocketConnector] Verifying connection and API readiness (timeout: {timeout_seconds}s)...", "DEBUG")
 
-    # Phase 1: Wait for WebSocket to be connected
-    while not global_value.websocket_is_connected:
-        if time.time() - start_time > timeout_seconds:
-            global_value.logger(f"[PocketConnector] Timeout: WebSocket not connected within {timeout_seconds}s (global_value.websocket_is_connected is False).", "WARNING")
-            return False
-        time.sleep(0.2) # Short sleep while polling websocket_is_connected
+    # Phase 1: Wait for WebSocket to be connected (set by the ws client on open/auth)
+    if not global_value.ws_connected_event.wait(timeout_seconds):
+        global_value.logger(f"[PocketConnector] Timeout: WebSocket not connected within {timeout_seconds}s (global_value.websocket_is_connected is False).", "WARNING")
+        return False
 
     global_value.logger("[PocketConnector] WebSocket is connected. Now checking for API readiness (e.g., balance).", "DEBUG")
 
@@ -114,40 +200,30 @@ def check_connection(timeout_seconds=10):
         global_value.logger("[PocketConnector] _api_instance is None during readiness check. This is unexpected.", "ERROR")
         return False
 
+    # The ws client sets balance_event when the first balance frame arrives,
+    # so wait on it for whatever is left of the overall timeout.
+    remaining = deadline - time.monotonic()
+    if remaining <= 0 or not global_value.balance_event.wait(remaining):
+        global_value.logger(f"[PocketConnector] Timeout: Balance not available within overall {timeout_seconds}s.", "WARNING")
+        return False
+
+    if not global_value.websocket_is_connected:
+        # If websocket disconnected while we were waiting for balance
+        global_value.logger("[PocketConnector] WebSocket disconnected while waiting for balance. Connection lost.", "WARNING")
+        return False
+
     balance_value = None
-    # Loop to check for balance, but respect the overall timeout
-    while True: 
-        # Check overall timeout first
-        if time.time() - start_time > timeout_seconds:
-            global_value.logger(f"[PocketConnector] Timeout: Balance not available (current value: {balance_value}) within overall {timeout_seconds}s.", "WARNING")
-            return False
-
-        if not global_value.websocket_is_connected:
-            # If websocket disconnects during this phase
-            global_value.logger("[PocketConnector] WebSocket disconnected while waiting for balance. Connection lost.", "WARNING")
-            return False
-
-        try:
-            balance_value = _api_instance.get_balance()
-        except Exception as e:
-            global_value.logger(f"[PocketConnector] Error calling get_balance(): {e}. Retrying...", "WARNING")
-            # Continue to retry within the timeout
-
-        if balance_value is not None:
-            green_color_code = "\033[92m"
-            reset_color_code = "\033[0m"
-            log_message = f'{green_color_code}[PocketConnector] Account Balance successfully retrieved: {balance_value}{reset_color_code}'
-            global_value.logger(log_message, "INFO")
-            return True
-        
-        # If balance is None, but websocket is connected, it means the profile/balance data
-        # hasn't arrived or been processed by the underlying library yet.
-        time.sleep(0.5) # Wait a bit longer for balance data to arrive
-
-    # Fallback, though the loop logic should handle returning True or False based on timeout/success
-    # This part of the original code is now covered by the loop above.
-    # If it reaches here, it implies an issue with the loop logic, which shouldn't happen.
-    global_value.logger("[PocketConnector] Exited check_connection logic unexpectedly.", "ERROR")
+    try:
+        balance_value = _cached_get_balance()
+    except Exception as e:
+        global_value.logger(f"[PocketConnector] Error calling get_balance(): {e}", "WARNING")
+
+    if balance_value is not None:
+        log_message = f'{_GREEN}[PocketConnector] Account Balance successfully retrieved: {balance_value}{_RESET}'
+        global_value.logger(log_message, "INFO")
+        return True
+
+    global_value.logger("[PocketConnector] Balance frame received but get_balance() returned None.", "WARNING")
     return False
 
 def check_trade_result(trade_id, timeout_seconds=180):
@@ -156,7 +232,8 @@ def check_trade_result(trade_id, timeout_seconds=180):
     Returns (profit, status) where status is "win", "loose", or "unknown"
     """
     _ensure_logger_initialized()
-    global_value.logger(f"[PocketConnector] Checking result for trade {trade_id}...", "DEBUG")
+    if global_value.is_debug():
+        global_value.logger(f"[PocketConnector] Checking result for trade {trade_id}...", "DEBUG")
     
     api = get_api_instance()
     if not api:
@@ -191,23 +268,36 @@ def monitor_trade_result(trade_id, expiration_time=None, callback=None):
             monitor_timeout = time.time() + 180  # Default 3 minutes
         
         start_time = time.time()
+        attempt = 0
+        # Bind hot-loop lookups to locals once
+        now = time.time
+        sleep = time.sleep
+        log = global_value.logger
+        is_debug = global_value.is_debug
+        check = check_trade_result
         
-        while time.time() < monitor_timeout:
+        while now() < monitor_timeout:
             try:
-                profit, status = check_trade_result(trade_id, timeout_seconds=5)
+                profit, status = check(trade_id, timeout_seconds=5)
                 
-                if status in ["win", "loose"]:
-                    global_value.logger(f"[PocketConnector] Trade {trade_id} completed: {status}, profit: {profit}", "INFO")
+                if status in ("win", "loose"):
+                    log(f"[PocketConnector] Trade {trade_id} completed: {status}, profit: {profit}", "INFO")
                     if callback:
                         callback(trade_id, profit, status)
                     return
                 elif status == "unknown":
-                    global_value.logger(f"[PocketConnector] Trade {trade_id} still pending...", "DEBUG")
+                    if is_debug():
+                        log(f"[PocketConnector] Trade {trade_id} still pending...", "DEBUG")
                 
             except Exception as e:
-                global_value.logger(f"[PocketConnector] Error monitoring trade {trade_id}: {e}", "WARNING")
+                log(f"[PocketConnector] Error monitoring trade {trade_id}: {e}", "WARNING")
             
-            time.sleep(3)  # Check every 3 seconds
+            # Adaptive re-check: start short, back off towards the old fixed 3s,
+            # never sleeping past the monitoring deadline
+            delay = min(0.01 * (1 << min(attempt, 9)), 3, monitor_timeout - now())
+            if delay > 0:
+                sleep(delay)
+            attempt += 1
         
         # Timeout reached
         global_value.logger(f"[PocketConnector] Trade {trade_id} monitoring timed out after {time.time() - start_time:.1f} seconds", "WARNING")
@@ -1,5 +1,12 @@
-from .api import PocketOptionAPI
-
 __version__ = "0.1.0"
 
 __all__ = ['PocketOptionAPI']
+
+
+def __getattr__(name):
+    # Resolve PocketOptionAPI on first access so importing a light submodule
+    # (e.g. global_value) doesn't drag in the websocket/requests stack.
+    if name == 'PocketOptionAPI':
+        from .api import PocketOptionAPI
+        return PocketOptionAPI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
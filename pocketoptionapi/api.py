@@ -75,6 +75,8 @@ class PocketOptionAPI(object):
 
     def start_websocket(self):
         global_value.websocket_is_connected = False
+        global_value.ws_connected_event.clear()
+        global_value.balance_event.clear()
         global_value.check_websocket_if_error = False
         global_value.websocket_error_reason = None
 
@@ -1,5 +1,5 @@
 from datetime import datetime
-import os, json
+import os, json, threading
 
 rp = os.path.normpath(os.path.dirname(os.path.abspath(__file__)) + '/../')
 dp = os.path.join(rp, 'history')
@@ -12,6 +12,10 @@ if not os.path.exists(os.path.join(dp, 'live')):
 
 # Global variables
 websocket_is_connected = False
+# Signalled alongside websocket_is_connected / the first balance frame so callers
+# can block on them instead of polling the flags
+ws_connected_event = threading.Event()
+balance_event = threading.Event()
 # try fix ssl.SSLEOFError: EOF occurred in violation of protocol (_ssl.c:2361)
 ssl_Mutual_exclusion = False  # mutex read write
 # if false websocket can sent self.websocket.send(data)
@@ -44,6 +48,11 @@ loglevel = 'INFO'
 # To get the payment details for the different pairs
 PayoutData = None
 
+def is_debug():
+    """True when DEBUG messages will be printed; lets callers skip building them otherwise."""
+    return loglevel == 'DEBUG'
+
+
 def logger(message, lvl):
     if loglevel == 'DEBUG':
         dt = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")
@@ -71,6 +71,7 @@ class PocketOption:
             if global_value.websocket_is_connected:
                 asyncio.run(self.api.close())
                 global_value.websocket_is_connected = False
+                global_value.ws_connected_event.clear()
                 # logger.debug("WebSocket connection closed successfully.")
                 global_value.logger("WebSocket connection closed successfully.", "DEBUG")
             else:
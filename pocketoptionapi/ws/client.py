@@ -17,6 +17,7 @@ async def on_open():
     global_value.logger("CONNECTED SUCCESSFUL", "INFO")
     global_value.logger("Websocket client connected.", "DEBUG")
     global_value.websocket_is_connected = True
+    global_value.ws_connected_event.set()
 
 
 async def send_ping(ws):
@@ -99,6 +100,7 @@ class WebsocketClient(object):
                         self.websocket = ws
                         self.url = url
                         global_value.websocket_is_connected = True
+                        global_value.ws_connected_event.set()
 
                         # Create and run tasks
                         on_message_task = asyncio.create_task(self.websocket_listener(ws))
@@ -109,12 +111,14 @@ class WebsocketClient(object):
 
                 except websockets.ConnectionClosed as e:
                     global_value.websocket_is_connected = False
+                    global_value.ws_connected_event.clear()
                     await self.on_close(e)
                     # logger.warning("Trying another server")
                     global_value.logger("Trying another server", "WARNING")
 
                 except Exception as e:
                     global_value.websocket_is_connected = False
+                    global_value.ws_connected_event.clear()
                     await self.on_error(e)
 
             await asyncio.sleep(1)
@@ -167,6 +171,7 @@ class WebsocketClient(object):
                     global_value.balance_id = message["uid"]
                 global_value.balance = message["balance"]
                 global_value.balance_type = message["isDemo"]
+                global_value.balance_event.set()
 
             elif "requestId" in message and message["requestId"] == 'buy':
                 global_value.order_data = message
@@ -259,3 +264,4 @@ class WebsocketClient(object):
         # logger.debug("Websocket connection closed.")
         # logger.warning(f"Websocket connection closed. Reason: {error}")
         global_value.websocket_is_connected = False
+        global_value.ws_connected_event.clear()
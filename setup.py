@@ -1,3 +1,4 @@
+import os
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
@@ -6,6 +7,12 @@ with open("README.md", "r", encoding="utf-8") as fh:
 with open("requirements.txt", "r", encoding="utf-8") as fh:
     requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
 
+ext_modules = []
+if os.environ.get("MYPYC_SIGNAL_TEXT") == "1":
+    # Opt-in ahead-of-time build of the signal parser's string helpers (requires mypy)
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["signal_text.py"])
+
 setup(
     name="pocketoptionapi",
     version="0.1.1",
@@ -22,4 +29,5 @@ setup(
     ],
     python_requires=">=3.6",
     install_requires=requirements,
+    ext_modules=ext_modules,
 ) 
@@ -0,0 +1,83 @@
+"""
+Pure string helpers behind detectsignal's signal parser and Telegram sign-in.
+
+Kept free of detectsignal's globals and fully annotated so the module can be compiled
+ahead of time with mypyc (MYPYC_SIGNAL_TEXT=1 python setup.py build_ext --inplace);
+the plain .py file is used when no compiled build is present.
+"""
+
+import re
+from typing import Optional, Tuple
+
+OTC_SPLIT_RE = re.compile(r'_otc', re.IGNORECASE)
+DROP_SLASHES = str.maketrans('', '', '/')
+POCKET_DIRECTION_SYMBOLS = frozenset('⬇⬆↓↑')
+# Sign-in error text that means Telegram wants the 2FA cloud password
+# ('password' also covers 'cloud password'); one scan instead of a substring test per keyword
+TWO_FACTOR_HINT_RE = re.compile(r"password|two[- ]factor|2fa")
+
+
+def scan_pocket_signal(message_text: str) -> Optional[Tuple[str, str, int]]:
+    """
+    String-method parse of the Pocket Option bot layout: a leading "SIGNAL <arrow>" line,
+    then "Asset: <name>", then "Expiration: M<n>".
+    Returns (direction_symbol, asset_name, expiration_minutes), or None when the message
+    is not in exactly that shape (the caller then falls back to its regex).
+    """
+    lines = message_text.split('\n')
+    last = len(lines) - 1
+    direction: Optional[str] = None
+    asset: Optional[str] = None
+    for i, line in enumerate(lines):
+        line = line.strip()
+        if direction is None:
+            if not line:
+                continue
+            # The SIGNAL line must come first, like the regex's earliest match
+            symbol = line[6:].strip()
+            if line[:6].upper() != 'SIGNAL' or symbol not in POCKET_DIRECTION_SYMBOLS or i == last:
+                return None
+            direction = symbol
+            continue
+        key, sep, value = line.partition(':')
+        if not sep:
+            continue
+        key = key.lower()
+        if asset is None:
+            if key == 'asset' and i < last:
+                value = value.strip()
+                name = value[1:] if value[:1] == '#' else value
+                if name and name.replace('_', 'a').replace('-', 'a').isalnum():
+                    asset = value
+            continue
+        if key == 'expiration':
+            value = value.strip()
+            if value[:1] not in ('M', 'm'):
+                return None
+            digits = value[1:]
+            count = len(digits) - len(digits.lstrip('0123456789'))
+            return (direction, asset, int(digits[:count])) if count else None
+    return None
+
+
+def normalize_pair(raw_pair_text: str) -> str:
+    """
+    Normalizes pair string from formats like "BHD/CNY OTC", "EURUSD", "AUD/CAD_otc".
+    Output: "BHDCNY_otc", "EURUSD", "AUDCAD_otc" (slash removed, _otc is lowercase, base is uppercase)
+    """
+    normalized_pair = raw_pair_text.strip() # Keep original case for a moment for OTC checks
+
+    # Standardize OTC suffix to _otc and ensure base is uppercase and slashes removed
+    if normalized_pair.upper().endswith(" OTC"): # Handles "BHD/CNY OTC"
+        base = normalized_pair[:-4].strip()
+        normalized_pair = base.upper().translate(DROP_SLASHES) + "_otc"
+    elif "_otc" in normalized_pair.lower(): # Handles "AUD/CAD_otc" or "EURUSD_otc" or "EURUSD_OTC"
+        # Split by _otc (case-insensitive), take the first part, uppercase, remove slashes, add _otc
+        parts = OTC_SPLIT_RE.split(normalized_pair)
+        normalized_pair = parts[0].upper().translate(DROP_SLASHES) + "_otc"
+    else: # Handles "EURUSD" or "USD/JPY"
+        normalized_pair = normalized_pair.upper().translate(DROP_SLASHES)
+
+    # Ensure any remaining _OTC (if somehow missed) becomes _otc - defensive
+    normalized_pair = normalized_pair.replace("_OTC", "_otc")
+    return normalized_pair
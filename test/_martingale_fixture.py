@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Shared Martingale expectations for the queue/feedback test scripts.
+"""
+
+import numpy as np
+
+# Account get_current_martingale_status() reports on, and the default worker for trade results
+WORKER = 'pelly_demo'
+
+def fresh_account(detectsignal, mult=2.0, base=1.0, worker_name=WORKER):
+    """Set the global Martingale defaults and give worker_name a clean state carrying the same settings"""
+    detectsignal.configure_martingale(enabled=True, multiplier=mult, default_amount=base)
+    detectsignal.seed_account_for_testing(worker_name, base, mult)
+
+def expected_mg_queue(base, mult, n):
+    """Amounts queued after n straight losses: [base * mult**1, ..., base * mult**n]"""
+    return (np.cumprod(np.full(n, mult, dtype=float)) * base).tolist()
+
+def expected_mg_levels(base, mult, n):
+    """Stake after 0..n-1 straight losses: the geometric series base, base * mult, ..., base * mult**(n-1)"""
+    return np.geomspace(base, base * mult ** (n - 1), n).tolist()
@@ -0,0 +1,8 @@
+#!/usr/bin/env python3
+"""
+Console-output helper for the test scripts; the implementation lives in tools/_console.py.
+"""
+
+from tools._console import buffered_output
+
+__all__ = ['buffered_output']
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Shared Telegram configuration and client factory for the bot test scripts.
+"""
+
+import os
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from telethon import TelegramClient
+
+# Your account configuration
+CFG = SimpleNamespace(
+    API_ID='23324590',
+    API_HASH='fdcd53d426aebd07096ff326bb124397',
+    PHONE_NUMBER='+2348101572723',
+    SESSION_NAME='my_signal_listener',
+    BOT_USERNAME='@PocketSignalBot',  # Bot username
+    BOT_ID=1385109737,  # Pocket Option Official Signal Bot
+    SESSION_PATH=os.path.join('../telegram_sessions', 'my_signal_listener'),
+)
+
+def make_client():
+    """Create a TelegramClient on the shared session, ensuring its folder exists"""
+    os.makedirs(os.path.dirname(CFG.SESSION_PATH), exist_ok=True)
+    return TelegramClient(CFG.SESSION_PATH, CFG.API_ID, CFG.API_HASH)
+
+@asynccontextmanager
+async def connected_client():
+    """
+    Connect a make_client() client for the duration of the block and always disconnect.
+    Unlike `async with client:` this does not call client.start(), so an unauthorized
+    session is reported by the caller instead of triggering an interactive login.
+    """
+    client = make_client()
+    await client.connect()
+    try:
+        yield client
+    finally:
+        await client.disconnect()
+        print("🔌 Disconnected from Telegram")
+
+async def resolve_bot(client, ident=None):
+    """
+    Resolve the bot from the session's entity cache (no server call), falling back to
+    a full get_entity lookup on a cold session. A cache hit returns an InputPeer, which
+    carries the id/access_hash but not profile fields like first_name.
+    """
+    ident = CFG.BOT_ID if ident is None else ident
+    try:
+        return await client.get_input_entity(ident)
+    except ValueError:
+        return await client.get_entity(ident)
@@ -3,32 +3,82 @@
 Demo: Global vs Per-Trade Queue Systems
 Demonstrates the difference between current global system and requested per-trade system
 """
+import logging
+from collections import defaultdict, deque
+
+log = logging.getLogger(__name__)
+
+MAX_LOSSES = 32  # Loss streaks covered by the precomputed amount tables
+
+
+def _make_pow(multiplier):
+    """multiplier**k, using an integer shift for the common doubling case"""
+    if multiplier == 2.0:
+        return lambda k: float(1 << k)
+    return lambda k, m=multiplier: m ** k
+
+
+def _build_amount_table(base_amount, pow_fn):
+    """Martingale amount for each loss count: index i -> base * multiplier**i"""
+    return tuple(base_amount * pow_fn(i) for i in range(MAX_LOSSES + 1))
+
+
+class _Amounts:
+    """Defers queue formatting until a log record is actually emitted"""
+    __slots__ = ("values",)
+
+    def __init__(self, values):
+        self.values = values
+
+    def __str__(self):
+        return str([f'${x:.2f}' for x in self.values])
+
+    __repr__ = __str__
+
+
+def _amount_for(table, base_amount, pow_fn, losses):
+    """Table lookup with a pow() fallback for streaks beyond MAX_LOSSES"""
+    if losses < len(table):
+        return table[losses]
+    return base_amount * pow_fn(losses)
+
 
 class GlobalQueueSystem:
     """Current implementation: ONE global queue, any win resets everything"""
     def __init__(self, base_amount=1.0, multiplier=2.0):
         self.base_amount = base_amount
         self.multiplier = multiplier
-        self.global_queue = []
+        self.global_queue = deque()
         self.consecutive_losses = 0
+        self._pow = _make_pow(multiplier)
+        self._amounts = _build_amount_table(base_amount, self._pow)
         
     def get_trade_amount(self):
         if self.global_queue:
-            return self.global_queue.pop(0)  # FIFO
+            return self.global_queue.popleft()  # FIFO
         return self.base_amount
     
     def handle_loss(self, trade_id, amount):
         self.consecutive_losses += 1
-        next_amount = self.base_amount * (self.multiplier ** self.consecutive_losses)
+        next_amount = _amount_for(self._amounts, self.base_amount, self._pow, self.consecutive_losses)
         self.global_queue.append(next_amount)
-        print(f"  Global Loss #{self.consecutive_losses}: Next amount ${next_amount:.2f} added to queue")
-        print(f"  Global Queue: {[f'${x:.2f}' for x in self.global_queue]}")
+        log.debug("  Global Loss #%d: Next amount $%.2f added to queue", self.consecutive_losses, next_amount)
+        log.debug("  Global Queue: %s", _Amounts(self.global_queue))
     
     def handle_win(self, trade_id, amount):
         self.global_queue.clear()  # ANY WIN resets EVERYTHING
         self.consecutive_losses = 0
-        print(f"  Global Win: Queue CLEARED, back to base ${self.base_amount:.2f}")
-        print(f"  Global Queue: {self.global_queue}")
+        log.debug("  Global Win: Queue CLEARED, back to base $%.2f", self.base_amount)
+        log.debug("  Global Queue: %s", _Amounts(self.global_queue))
+
+
+class TradeState:
+    """Martingale progression for a single trade symbol"""
+    __slots__ = ("queue", "losses")
+    
+    def __init__(self):
+        self.queue = deque()
+        self.losses = 0
 
 
 class PerTradeQueueSystem:
@@ -36,37 +86,34 @@ class PerTradeQueueSystem:
     def __init__(self, base_amount=1.0, multiplier=2.0):
         self.base_amount = base_amount
         self.multiplier = multiplier
-        self.trade_queues = {}  # trade_id -> [amounts]
-        self.trade_losses = {}  # trade_id -> consecutive_losses
+        self.trades: defaultdict[str, TradeState] = defaultdict(TradeState)  # trade_id -> queue + consecutive losses
+        self._pow = _make_pow(multiplier)
+        self._amounts = _build_amount_table(base_amount, self._pow)
         
     def get_trade_amount(self, trade_id):
-        if trade_id in self.trade_queues and self.trade_queues[trade_id]:
-            return self.trade_queues[trade_id].pop(0)  # FIFO from this trade's queue
-        return self.base_amount
+        st = self.trades.get(trade_id)
+        return st.queue.popleft() if st and st.queue else self.base_amount  # FIFO from this trade's queue
     
     def handle_loss(self, trade_id, amount):
-        # Initialize if first time
-        if trade_id not in self.trade_losses:
-            self.trade_losses[trade_id] = 0
-            self.trade_queues[trade_id] = []
-            
-        self.trade_losses[trade_id] += 1
-        next_amount = self.base_amount * (self.multiplier ** self.trade_losses[trade_id])
-        self.trade_queues[trade_id].append(next_amount)
+        st = self.trades[trade_id]  # created on first loss
+        st.losses += 1
+        next_amount = _amount_for(self._amounts, self.base_amount, self._pow, st.losses)
+        st.queue.append(next_amount)
         
-        print(f"  Trade {trade_id} Loss #{self.trade_losses[trade_id]}: Next amount ${next_amount:.2f} added to ITS queue")
-        print(f"  Trade {trade_id} Queue: {[f'${x:.2f}' for x in self.trade_queues[trade_id]]}")
+        log.debug("  Trade %s Loss #%d: Next amount $%.2f added to ITS queue", trade_id, st.losses, next_amount)
+        log.debug("  Trade %s Queue: %s", trade_id, _Amounts(st.queue))
     
     def handle_win(self, trade_id, amount):
         # Only reset THIS trade's queue
-        if trade_id in self.trade_queues:
-            self.trade_queues[trade_id].clear()
-        if trade_id in self.trade_losses:
-            self.trade_losses[trade_id] = 0
+        st = self.trades.get(trade_id)
+        if st is not None:
+            st.queue.clear()
+            st.losses = 0
             
-        print(f"  Trade {trade_id} Win: Only ITS queue cleared, back to base ${self.base_amount:.2f}")
-        print(f"  Trade {trade_id} Queue: {self.trade_queues.get(trade_id, [])}")
-        print(f"  Other queues remain: {[(k, [f'${x:.2f}' for x in v]) for k, v in self.trade_queues.items() if k != trade_id and v]}")
+        log.debug("  Trade %s Win: Only ITS queue cleared, back to base $%.2f", trade_id, self.base_amount)
+        log.debug("  Trade %s Queue: %s", trade_id, _Amounts(st.queue if st else ()))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("  Other queues remain: %s", [(k, _Amounts(v.queue)) for k, v in self.trades.items() if k != trade_id and v.queue])
 
 
 def demo_scenario():
@@ -132,6 +179,8 @@ def demo_scenario():
 
 
 if __name__ == "__main__":
+    # The demo narrates each queue change, so show the debug-level trace
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     demo_scenario()
     
     print("\n" + "=" * 70)
@@ -0,0 +1,28 @@
+"""
+pytest setup for the test scripts.
+
+The scripts are also run directly (python test/<name>.py), which puts this folder on
+sys.path; mirror that here so the shared _*_fixture helpers import the same way
+under pytest. Each test starts from clean detectsignal Martingale state, so the
+integration tests are order-independent and can be spread across workers
+(pytest -n auto with pytest-xdist).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+_TEST_DIR = Path(__file__).resolve().parent
+for _path in (str(_TEST_DIR), str(_TEST_DIR.parent)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+
+@pytest.fixture(autouse=True)
+def reset_martingale_state():
+    """Clear detectsignal's per-account Martingale bookkeeping before each test"""
+    detectsignal = sys.modules.get('detectsignal')
+    if detectsignal is not None:
+        detectsignal.reset_for_testing()
+    yield
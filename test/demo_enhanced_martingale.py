@@ -5,19 +5,27 @@ This simulates real-world scenarios where signals arrive for any symbol at any t
 """
 
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pathlib import Path
+project_root = str(Path(__file__).resolve().parents[1])
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 import detectsignal
 import time
+import numpy as np
+from _martingale_fixture import WORKER, fresh_account
+
+def martingale_progression(base_amount, multiplier, n):
+    """Amounts queued by n consecutive losses: base * multiplier**1 .. base * multiplier**n"""
+    return base_amount * np.cumprod(np.full(n, multiplier, dtype=float))
 
 def demo_global_queue_based_martingale():
     """Demonstrate how the global queue-based system works"""
     print("🚀 Global Queue-Based Martingale System Demo")
     print("=" * 70)
     
-    # Initialize the system (same as bot.py would do)
-    detectsignal.initialize_martingale_system(2.5, enabled=True)
+    # Fresh Martingale state for the demo account (multiplier 2.5)
+    fresh_account(detectsignal, mult=2.5)
     
     print("📊 Scenario: Mixed signals arrive, some symbols may not repeat")
     print("-" * 70)
@@ -55,13 +63,13 @@ def demo_global_queue_based_martingale():
         if "signals arrive" in scenario_name:
             # Process new signals
             for symbol, direction, description in actions:
-                amount = detectsignal._get_trade_amount_for_new_signal()
+                amount = detectsignal._get_trade_amount_for_new_signal(WORKER)
                 print(f"  → {description}: {symbol} {direction.upper()} ${amount}")
         
         elif "lose" in scenario_name or "results" in scenario_name:
             # Process trade results
             for trade_id, symbol, result, pnl in actions:
-                detectsignal._handle_trade_result(trade_id, symbol, result, pnl)
+                detectsignal._handle_trade_result(trade_id, symbol, result, pnl, WORKER)
                 result_icon = "✅" if result == "win" else "❌"
                 print(f"  → {result_icon} {symbol} {result.upper()} (P&L: ${pnl})")
         
@@ -93,9 +101,8 @@ def demo_global_queue_based_martingale():
     print("=" * 70)
     
     # Clear and demo a realistic flow
-    detectsignal._consecutive_losses = 0
-    detectsignal._martingale_queue.clear()
-    detectsignal._active_trades_count = 0
+    detectsignal.reset_for_testing()
+    fresh_account(detectsignal, mult=2.5)
     
     example_flow = [
         "1️⃣ EURUSD signal arrives → $1.00 (fresh start)",
@@ -126,9 +133,8 @@ def demo_queue_buildup_scenario():
     print("="*70)
     
     # Reset system
-    detectsignal._consecutive_losses = 0
-    detectsignal._martingale_queue.clear()
-    detectsignal._active_trades_count = 0
+    detectsignal.reset_for_testing()
+    fresh_account(detectsignal, mult=2.5)
     
     print("🎯 Scenario: Multiple losses create queue buildup")
     print()
@@ -139,7 +145,7 @@ def demo_queue_buildup_scenario():
     
     print("📡 5 signals arrive:")
     for i, symbol in enumerate(symbols, 1):
-        amount = detectsignal._get_trade_amount_for_new_signal()
+        amount = detectsignal._get_trade_amount_for_new_signal(WORKER)
         trade_amounts.append(amount)
         print(f"  {i}. {symbol}: ${amount}")
     
@@ -149,20 +155,23 @@ def demo_queue_buildup_scenario():
     print("\n💥 All 5 trades lose:")
     for i, symbol in enumerate(symbols, 1):
         trade_id = f"trade_{i}"
-        detectsignal._handle_trade_result(trade_id, symbol, "loss", -trade_amounts[i-1])
+        detectsignal._handle_trade_result(trade_id, symbol, "loss", -trade_amounts[i-1], WORKER)
         status = detectsignal.get_current_martingale_status()
         print(f"  {i}. {symbol} loses → Queue: {status['queued_amounts']}")
     
     final_status = detectsignal.get_current_martingale_status()
-    total_queued = sum(final_status['queued_amounts'])
+    queued = np.asarray(final_status['queued_amounts'], dtype=float)
+    total_queued = queued.sum()
+    expected = martingale_progression(trade_amounts[0], final_status['martingale_multiplier'], len(symbols))
     print(f"\n📈 Final Queue: {final_status['queued_amounts']}")
-    print(f"💰 Total Queued Exposure: ${total_queued:.2f}")
+    print(f"📐 Expected Progression: {np.round(expected, 2).tolist()}")
+    print(f"💰 Total Queued Exposure: ${total_queued:.2f} (expected ${expected.sum():.2f})")
     print(f"🔢 Consecutive Losses: {final_status['consecutive_losses']}")
     
     # Show what happens with new signals
     print(f"\n📡 Next 3 signals will use queued amounts:")
     for i in range(3):
-        amount = detectsignal._get_trade_amount_for_new_signal()
+        amount = detectsignal._get_trade_amount_for_new_signal(WORKER)
         remaining_status = detectsignal.get_current_martingale_status()
         print(f"  Signal {i+1}: ${amount} (queue remaining: {remaining_status['queued_amounts']})")
     
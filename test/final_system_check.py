@@ -5,11 +5,12 @@ Comprehensive check of all system components
 """
 
 import sys
-import os
+from pathlib import Path
 
 # Add the project root to Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
+project_root = str(Path(__file__).resolve().parents[1])
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 def check_system_components():
     """Check all system components are working"""
@@ -157,8 +158,7 @@ def check_trade_result_flow():
             
             # Simulate trade
             trade_id = f"test_{i}"
-            detectsignal._pending_trade_results[trade_id] = {'symbol': f'PAIR{i}', 'amount': amount}
-            detectsignal._active_trades_count += 1
+            detectsignal._track_pending_trade(trade_id, f'PAIR{i}', amount)
             
             # Handle result
             detectsignal._handle_trade_result(trade_id, f'PAIR{i}', result, profit)
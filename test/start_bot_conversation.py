@@ -5,32 +5,12 @@ This will send a /start command to the bot to initiate communication.
 """
 
 import asyncio
-import os
-from telethon import TelegramClient, events
+from telethon import events
+from telethon.utils import get_peer_id
+from _telegram_fixture import CFG, connected_client, resolve_bot
 
-# Your account configuration
-API_ID = '23324590'
-API_HASH = 'fdcd53d426aebd07096ff326bb124397'
-PHONE_NUMBER = '+2348101572723'
-SESSION_NAME = 'my_signal_listener'
-BOT_USERNAME = '@PocketSignalBot'  # Bot username
-BOT_ID = 1385109737  # Bot ID
-
-async def start_conversation_with_bot():
-    # Ensure session directory exists
-    session_folder = "../telegram_sessions"
-    if not os.path.exists(session_folder):
-        os.makedirs(session_folder)
-        print(f"Created directory: {session_folder}")
-    
-    full_session_path = os.path.join(session_folder, SESSION_NAME)
-    
-    client = TelegramClient(full_session_path, API_ID, API_HASH)
-    
+async def start_conversation_with_bot(client):
     try:
-        print("🔗 Connecting to Telegram...")
-        await client.connect()
-        
         if not await client.is_user_authorized():
             print("❌ User not authorized. Please run test_telethon_auth.py first.")
             return False
@@ -39,43 +19,57 @@ async def start_conversation_with_bot():
         
         # Try to get the bot by username first
         try:
-            print(f"🔍 Looking up bot by username: {BOT_USERNAME}")
-            bot_entity = await client.get_entity(BOT_USERNAME)
+            print(f"🔍 Looking up bot by username: {CFG.BOT_USERNAME}")
+            bot_entity = await client.get_entity(CFG.BOT_USERNAME)
             print(f"✅ Found bot: {bot_entity.first_name}")
             print(f"   Username: @{bot_entity.username}")
             print(f"   ID: {bot_entity.id}")
             print(f"   Is Bot: {bot_entity.bot}")
             
+            # One-shot listener so we stop waiting as soon as the bot replies
+            reply_evt = asyncio.Event()
+            
+            async def _on_reply(event):
+                reply_evt.set()
+            
+            client.add_event_handler(_on_reply, events.NewMessage(chats=[bot_entity.id]))
+            
             # Send /start command to initiate conversation
-            print(f"\n📤 Sending /start command to {BOT_USERNAME}...")
+            print(f"\n📤 Sending /start command to {CFG.BOT_USERNAME}...")
             await client.send_message(bot_entity, '/start')
             print("✅ /start command sent successfully!")
             
-            # Wait a moment for any auto-reply
+            # Wait (up to 3s) for any auto-reply
             print("⏳ Waiting for bot response...")
-            await asyncio.sleep(3)
+            try:
+                await asyncio.wait_for(reply_evt.wait(), 3.0)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                client.remove_event_handler(_on_reply)
             
             # Try to get recent messages from the bot
             print("📬 Checking for messages from the bot...")
-            async for message in client.iter_messages(bot_entity, limit=5):
+            messages = await client.get_messages(bot_entity, limit=5)
+            for message in messages:
                 print(f"   📩 {message.date}: {message.message}")
             
             return True
             
         except Exception as e:
-            print(f"❌ Could not find bot by username {BOT_USERNAME}: {e}")
+            print(f"❌ Could not find bot by username {CFG.BOT_USERNAME}: {e}")
             
             # Try direct message to bot ID
             try:
-                print(f"🔍 Trying to access bot by ID: {BOT_ID}")
-                bot_entity = await client.get_entity(BOT_ID)
-                print(f"✅ Found bot by ID: {bot_entity.first_name}")
+                print(f"🔍 Trying to access bot by ID: {CFG.BOT_ID}")
+                bot_entity = await resolve_bot(client)
+                print(f"✅ Found bot by ID: {getattr(bot_entity, 'first_name', '(from session cache)')}")
                 return True
             except Exception as e2:
                 print(f"❌ Could not access bot by ID either: {e2}")
                 print("\n🔧 SOLUTION:")
                 print("1. Open Telegram app on your phone/computer")
-                print(f"2. Search for '{BOT_USERNAME}' or 'Pocket Option Official Signal Bot'")
+                print(f"2. Search for '{CFG.BOT_USERNAME}' or 'Pocket Option Official Signal Bot'")
                 print("3. Start a conversation by sending /start to the bot")
                 print("4. Wait for the bot to respond")
                 print("5. Then run this script again")
@@ -84,21 +78,21 @@ async def start_conversation_with_bot():
     except Exception as e:
         print(f"❌ Connection error: {e}")
         return False
+
+async def listen_window(client, seconds):
+    """Print messages from the bot for a fixed window, then drop the handler"""
+    async def _on_message(event):
+        print(f"📩 Received message: {event.message.message}")
+    
+    client.add_event_handler(_on_message, events.NewMessage(chats=[CFG.BOT_ID]))
+    try:
+        await asyncio.sleep(seconds)
     finally:
-        if client.is_connected():
-            await client.disconnect()
-            print("🔌 Disconnected from Telegram")
+        client.remove_event_handler(_on_message)
 
-async def test_bot_access_after_conversation():
+async def test_bot_access_after_conversation(client, listener):
     """Test if we can now access the bot after starting conversation"""
-    session_folder = "../telegram_sessions"
-    full_session_path = os.path.join(session_folder, SESSION_NAME)
-    
-    client = TelegramClient(full_session_path, API_ID, API_HASH)
-    
     try:
-        await client.connect()
-        
         if not await client.is_user_authorized():
             print("❌ User not authorized.")
             return False
@@ -108,17 +102,12 @@ async def test_bot_access_after_conversation():
         
         # Test by ID
         try:
-            bot_entity = await client.get_entity(BOT_ID)
-            print(f"✅ Bot accessible by ID: {bot_entity.first_name} (ID: {bot_entity.id})")
+            bot_entity = await resolve_bot(client)
+            print(f"✅ Bot accessible by ID: {getattr(bot_entity, 'first_name', '(from session cache)')} (ID: {get_peer_id(bot_entity, add_mark=False)})")
             
-            # Set up a temporary message listener
-            print("🎯 Setting up message listener for 10 seconds...")
-            
-            @client.on(events.NewMessage(chats=[BOT_ID]))
-            async def temp_handler(event):
-                print(f"📩 Received message: {event.message.message}")
-            
-            await asyncio.sleep(10)  # Listen for 10 seconds
+            # The listener window was opened before /start; wait out what is left of it
+            print("🎯 Waiting for the message listener window to close...")
+            await listener
             print("✅ Message listener test completed!")
             return True
             
@@ -129,9 +118,42 @@ async def test_bot_access_after_conversation():
     except Exception as e:
         print(f"❌ Test error: {e}")
         return False
-    finally:
-        if client.is_connected():
-            await client.disconnect()
+
+async def amain():
+    """Run both steps over one connected client so the authorized session is reused"""
+    try:
+        print("🔗 Connecting to Telegram...")
+        async with connected_client() as client:
+            # Open the 10s listener window up front so it overlaps step 1's reply wait
+            print("🎯 Setting up message listener for 10 seconds...")
+            listener = asyncio.create_task(listen_window(client, 10))
+            
+            # Step 1: Try to start conversation
+            success = await start_conversation_with_bot(client)
+            
+            if success:
+                print("\n✅ SUCCESS: Conversation started with the bot!")
+                print("🔄 Now testing bot access...")
+                
+                # Step 2: Test access
+                test_success = await test_bot_access_after_conversation(client, listener)
+                
+                if test_success:
+                    print("\n🎉 PERFECT: Bot is now accessible!")
+                    print("   Your signal detector should now work correctly.")
+                    print("   You can run your main trading bot.")
+                else:
+                    print("\n⚠️  Bot conversation started but access test failed.")
+                    print("   Try running the bot connection test again in a few minutes.")
+            else:
+                print("\n❌ FAILED: Could not start conversation with bot.")
+                print("   Please follow the manual steps above.")
+            
+            if not listener.done():
+                listener.cancel()
+    
+    except Exception as e:
+        print(f"❌ Connection error: {e}")
 
 def main():
     print("🤖 Pocket Option Signal Bot - Start Conversation")
@@ -140,26 +162,14 @@ def main():
     print("so that your trading bot can receive signals from it.")
     print("=" * 55)
     
-    # Step 1: Try to start conversation
-    success = asyncio.run(start_conversation_with_bot())
+    try:
+        # Faster drop-in event loop when available; stock asyncio otherwise
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     
-    if success:
-        print("\n✅ SUCCESS: Conversation started with the bot!")
-        print("🔄 Now testing bot access...")
-        
-        # Step 2: Test access
-        test_success = asyncio.run(test_bot_access_after_conversation())
-        
-        if test_success:
-            print("\n🎉 PERFECT: Bot is now accessible!")
-            print("   Your signal detector should now work correctly.")
-            print("   You can run your main trading bot.")
-        else:
-            print("\n⚠️  Bot conversation started but access test failed.")
-            print("   Try running the bot connection test again in a few minutes.")
-    else:
-        print("\n❌ FAILED: Could not start conversation with bot.")
-        print("   Please follow the manual steps above.")
+    asyncio.run(amain())
 
 if __name__ == "__main__":
     main()
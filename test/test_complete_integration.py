@@ -4,16 +4,25 @@ Integration Test: Complete Signal-to-Martingale Flow
 Tests the entire flow from signal detection to trade result and Martingale update
 """
 
-import time
-import threading
-from unittest.mock import Mock, patch
 import sys
-import os
+from pathlib import Path
+from math import isclose
 
 # Add the project root to Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
+project_root = str(Path(__file__).resolve().parents[1])
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
+import detectsignal
+import pocketoptionapi.global_value as global_value
+from _martingale_fixture import WORKER, expected_mg_queue, fresh_account
+from _output_fixture import buffered_output
+
+def _fresh_mg(mult=2.0, base=1.0):
+    """Configure a clean Martingale run for WORKER (other state is reset per test by conftest.py)"""
+    fresh_account(detectsignal, mult=mult, base=base)
+
+@buffered_output
 def test_complete_signal_to_martingale_flow():
     """Test the complete flow: Signal → Trade → Result → Martingale Update"""
     print("🔄 Testing Complete Signal-to-Martingale Flow")
@@ -32,15 +41,11 @@ def test_complete_signal_to_martingale_flow():
         print(f"   {i}. {trade['symbol']} {trade['action'].upper()} ${trade['amount']:.2f} → {trade['result'].upper()}")
     print()
     
-    # Import required modules
-    import detectsignal
-    import pocketoptionapi.global_value as global_value
-    
     # Setup logging
     global_value.logger = lambda msg, level="INFO": print(f"[{level}] {msg}")
     
     # Initialize detectsignal with test settings
-    detectsignal.configure_martingale(enabled=True, multiplier=2.5, default_amount=1.0)
+    _fresh_mg(mult=2.5)
     
     print("🎯 Initial Martingale Status:")
     status = detectsignal.get_current_martingale_status()
@@ -50,31 +55,33 @@ def test_complete_signal_to_martingale_flow():
     print(f"   Losses: {status['consecutive_losses']}")
     print()
     
+    # Bind hot-loop callables once
+    _get_amt = detectsignal._get_trade_amount_for_new_signal
+    _handle = detectsignal._handle_trade_result
+    _status = detectsignal.get_current_martingale_status
+    _track = detectsignal._track_pending_trade
+    
     # Execute test trades
     for i, trade in enumerate(scenario_trades, 1):
         print(f"🎬 Trade {i}: {trade['symbol']} {trade['action'].upper()}")
         
         # Get trade amount (this simulates signal processing)
-        trade_amount = detectsignal._get_trade_amount_for_new_signal()
+        trade_amount = _get_amt(WORKER)
         expected_amount = trade['amount']
         
         print(f"   Expected Amount: ${expected_amount:.2f}")
         print(f"   Calculated Amount: ${trade_amount:.2f}")
         
-        if abs(trade_amount - expected_amount) < 0.01:
+        if isclose(trade_amount, expected_amount, abs_tol=0.01):
             print("   ✅ Amount calculation correct")
         else:
             print(f"   ❌ Amount mismatch! Expected ${expected_amount:.2f}, got ${trade_amount:.2f}")
         
-        # Simulate trade placement (create fake trade ID)
-        trade_id = f"trade_{i}_{int(time.time())}"
+        # Simulate trade placement (create fake trade ID; i is unique within the run)
+        trade_id = f"trade_{i}"
         
         # Track the trade (this simulates worker response)
-        detectsignal._pending_trade_results[trade_id] = {
-            'symbol': trade['symbol'],
-            'amount': trade_amount
-        }
-        detectsignal._active_trades_count += 1
+        _track(trade_id, trade['symbol'], trade_amount, worker_name=WORKER)
         
         print(f"   📊 Trade placed: ID {trade_id}")
         
@@ -85,10 +92,10 @@ def test_complete_signal_to_martingale_flow():
         print(f"   📈 Trade result: {result_status.upper()} (${profit})")
         
         # Handle the result (this simulates WorkerManager calling _handle_trade_result)
-        detectsignal._handle_trade_result(trade_id, trade['symbol'], result_status, profit)
+        _handle(trade_id, trade['symbol'], result_status, profit)
         
         # Check Martingale status after result
-        status_after = detectsignal.get_current_martingale_status()
+        status_after = _status()
         print(f"   📊 After result - Losses: {status_after['consecutive_losses']}, Queue: {status_after['queued_amounts']}")
         print()
     
@@ -107,44 +114,42 @@ def test_complete_signal_to_martingale_flow():
     
     if len(final_status['queued_amounts']) == 1:  # Should have one queued amount
         queued_amount = final_status['queued_amounts'][0]
-        expected_queued = 1.0 * 2.5  # Base amount * multiplier
-        if abs(queued_amount - expected_queued) < 0.01:
+        expected_queued = expected_mg_queue(1.0, 2.5, 1)[0]  # Base amount * multiplier
+        if isclose(queued_amount, expected_queued, abs_tol=0.01):
             print(f"✅ Queue correct: ${queued_amount:.2f} queued for next trade")
         else:
             print(f"❌ Queue incorrect: Expected ${expected_queued:.2f}, got ${queued_amount:.2f}")
     else:
         print(f"❌ Queue length incorrect: Expected 1 item, got {len(final_status['queued_amounts'])}")
 
+@buffered_output
 def test_martingale_queue_behavior():
     """Test specific queue behaviors"""
     print("🧪 Testing Martingale Queue Behaviors")
     print("=" * 70)
     
-    import detectsignal
-    import pocketoptionapi.global_value as global_value
-    
     # Setup logging
     global_value.logger = lambda msg, level="INFO": print(f"[{level}] {msg}")
     
     # Reset system
-    detectsignal.reset_martingale()
-    detectsignal.configure_martingale(enabled=True, multiplier=2.0, default_amount=1.0)
+    _fresh_mg()
     
     print("📋 Test: Multiple Concurrent Losses Build Queue")
     
+    # Bind hot-loop callables once
+    _get_amt = detectsignal._get_trade_amount_for_new_signal
+    _status = detectsignal.get_current_martingale_status
+    _track = detectsignal._track_pending_trade
+    
     # Simulate 3 concurrent trades that all lose
     trade_ids = []
     for i in range(3):
-        amount = detectsignal._get_trade_amount_for_new_signal()
+        amount = _get_amt(WORKER)
         trade_id = f"concurrent_trade_{i}"
         trade_ids.append(trade_id)
         
         # Track trade
-        detectsignal._pending_trade_results[trade_id] = {
-            'symbol': f'PAIR{i}_otc',
-            'amount': amount
-        }
-        detectsignal._active_trades_count += 1
+        _track(trade_id, f'PAIR{i}_otc', amount, worker_name=WORKER)
         
         print(f"   Trade {i+1}: ${amount:.2f} ({trade_id})")
     
@@ -152,13 +157,12 @@ def test_martingale_queue_behavior():
     print("💥 All 3 trades lose:")
     
     # All lose
-    for i, trade_id in enumerate(trade_ids):
-        detectsignal._handle_trade_result(trade_id, f'PAIR{i}_otc', 'loss', -1.0)
-        status = detectsignal.get_current_martingale_status()
-        print(f"   After loss {i+1}: Queue = {status['queued_amounts']}")
+    detectsignal._handle_trade_results_batch([(trade_id, f'PAIR{i}_otc', 'loss', -1.0) for i, trade_id in enumerate(trade_ids)])
+    status = _status()
+    print(f"   After {len(trade_ids)} losses: Queue = {status['queued_amounts']}")
     
-    final_status = detectsignal.get_current_martingale_status()
-    expected_queue = [2.0, 4.0, 8.0]  # Base * 2^1, 2^2, 2^3
+    final_status = _status()
+    expected_queue = expected_mg_queue(1.0, 2.0, len(trade_ids))  # Base * 2^1, 2^2, 2^3
     
     print(f"   Final Queue: {final_status['queued_amounts']}")
     print(f"   Expected:    {expected_queue}")
@@ -173,18 +177,18 @@ def test_martingale_queue_behavior():
     
     # Next trades should use queued amounts
     for i in range(3):
-        amount = detectsignal._get_trade_amount_for_new_signal()
+        amount = _get_amt(WORKER)
         expected = expected_queue[i]
         print(f"   Trade {i+1}: ${amount:.2f} (expected ${expected:.2f})")
         
-        if abs(amount - expected) < 0.01:
+        if isclose(amount, expected, abs_tol=0.01):
             print("   ✅ Correct amount from queue")
         else:
             print("   ❌ Wrong amount from queue")
     
     print()
     print("🎯 Queue should now be empty:")
-    final_status = detectsignal.get_current_martingale_status()
+    final_status = _status()
     print(f"   Queue: {final_status['queued_amounts']}")
     
     if len(final_status['queued_amounts']) == 0:
@@ -192,47 +196,50 @@ def test_martingale_queue_behavior():
     else:
         print("❌ Queue not empty")
 
+@buffered_output
 def test_win_reset_behavior():
     """Test that any win resets the entire system"""
     print("🏆 Testing Win Reset Behavior")
     print("=" * 70)
     
-    import detectsignal
-    import pocketoptionapi.global_value as global_value
-    
     # Setup logging
     global_value.logger = lambda msg, level="INFO": print(f"[{level}] {msg}")
     
     # Reset and configure
-    detectsignal.reset_martingale()
-    detectsignal.configure_martingale(enabled=True, multiplier=2.0, default_amount=1.0)
+    _fresh_mg()
     
     print("📋 Test: Build queue then win resets everything")
     
+    # Bind hot-loop callables once
+    _get_amt = detectsignal._get_trade_amount_for_new_signal
+    _handle = detectsignal._handle_trade_result
+    _status = detectsignal.get_current_martingale_status
+    _track = detectsignal._track_pending_trade
+    
     # Build up some losses
+    losses = []
     for i in range(3):
-        amount = detectsignal._get_trade_amount_for_new_signal()
+        amount = _get_amt(WORKER)
         trade_id = f"loss_trade_{i}"
-        detectsignal._pending_trade_results[trade_id] = {'symbol': f'PAIR{i}', 'amount': amount}
-        detectsignal._active_trades_count += 1
-        detectsignal._handle_trade_result(trade_id, f'PAIR{i}', 'loss', -amount)
+        _track(trade_id, f'PAIR{i}', amount, worker_name=WORKER)
+        losses.append((trade_id, f'PAIR{i}', 'loss', -amount))
+    detectsignal._handle_trade_results_batch(losses)
     
-    status_before = detectsignal.get_current_martingale_status()
+    status_before = _status()
     print(f"   After 3 losses - Queue: {status_before['queued_amounts']}")
     print(f"   Consecutive losses: {status_before['consecutive_losses']}")
     
     # Now win
-    win_amount = detectsignal._get_trade_amount_for_new_signal()
+    win_amount = _get_amt(WORKER)
     win_trade_id = "win_trade"
-    detectsignal._pending_trade_results[win_trade_id] = {'symbol': 'WINPAIR', 'amount': win_amount}
-    detectsignal._active_trades_count += 1
+    _track(win_trade_id, 'WINPAIR', win_amount, worker_name=WORKER)
     
     print(f"   Win trade amount: ${win_amount:.2f}")
     
     # Handle win
-    detectsignal._handle_trade_result(win_trade_id, 'WINPAIR', 'win', win_amount * 1.8)
+    _handle(win_trade_id, 'WINPAIR', 'win', win_amount * 1.8)
     
-    status_after = detectsignal.get_current_martingale_status()
+    status_after = _status()
     print(f"   After win - Queue: {status_after['queued_amounts']}")
     print(f"   Consecutive losses: {status_after['consecutive_losses']}")
     
@@ -243,34 +250,29 @@ def test_win_reset_behavior():
         print("❌ Win did not reset system properly")
     
     # Next trade should be base amount
-    next_amount = detectsignal._get_trade_amount_for_new_signal()
-    if abs(next_amount - 1.0) < 0.01:
+    next_amount = _get_amt(WORKER)
+    if isclose(next_amount, 1.0, abs_tol=0.01):
         print(f"✅ Next trade back to base amount: ${next_amount:.2f}")
     else:
         print(f"❌ Next trade not base amount: ${next_amount:.2f}")
 
+@buffered_output
+def test_precomputed_amount_table():
+    """Test the per-(base, multiplier) amount table matches base * mult**k"""
+    print("\n📐 Testing Precomputed Martingale Amount Table")
+    print("=" * 70)
+
+    table = detectsignal._mart_levels(1.0, 2.5)
+    print(f"   First entries: {table[:5]}")
+
+    assert len(table) == detectsignal._MG_POW_CACHE_SIZE
+    assert table[0] == 1.0
+    for got, expected in zip(table[1:], expected_mg_queue(1.0, 2.5, len(table) - 1)):
+        assert isclose(got, expected, abs_tol=0.01)
+    print("✅ Amount table matches the expected progression")
+
 if __name__ == "__main__":
-    print("🚀 Complete Signal-to-Martingale Integration Tests")
-    print("=" * 80)
-    print()
-    
-    try:
-        test_complete_signal_to_martingale_flow()
-        print()
-        test_martingale_queue_behavior()
-        print()
-        test_win_reset_behavior()
-        
-        print()
-        print("🎉 All Integration Tests Completed Successfully!")
-        print("=" * 80)
-        print("✅ Signal detection integrates with Martingale system")
-        print("✅ Trade results correctly update Martingale queue")
-        print("✅ Queue behavior matches expected Martingale progression")
-        print("✅ Win resets work correctly")
-        print("✅ System ready for live trading with proper feedback")
-        
-    except Exception as e:
-        print(f"❌ Integration test failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+    # Run through pytest so each test gets the fresh-state fixture from conftest.py
+    # (add -n auto with pytest-xdist installed to run them in parallel)
+    import pytest
+    sys.exit(pytest.main([__file__, "-s"] + sys.argv[1:]))
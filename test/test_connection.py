@@ -20,18 +20,14 @@ try:
     api.connect() # Explicit connect
     print("api.connect() called.")
 
-    # Wait for connection
+    # Wait for connection (ws_connected_event is set by the websocket's on_open)
     connection_timeout = 30
-    start_time = time.time()
-    connected = False
-    while time.time() - start_time < connection_timeout:
-        if global_value.websocket_is_connected:
-            print(f"SUCCESS: WebSocket connected after {time.time() - start_time:.2f} seconds!")
-            balance = api.get_balance()
-            print(f"Account Balance: {balance}")
-            connected = True
-            break
-        time.sleep(0.2)
+    start_time = time.monotonic()
+    connected = global_value.ws_connected_event.wait(timeout=connection_timeout)
+    if connected:
+        print(f"SUCCESS: WebSocket connected after {time.monotonic() - start_time:.2f} seconds!")
+        balance = api.get_balance()
+        print(f"Account Balance: {balance}")
 
     if not connected:
         print(f"FAILURE: WebSocket did NOT connect within {connection_timeout} seconds.")
@@ -5,18 +5,24 @@ Tests global loss tracking and queue-based amount assignment.
 """
 
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pathlib import Path
+project_root = str(Path(__file__).resolve().parents[1])
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 import detectsignal
+from math import isclose
+from _martingale_fixture import WORKER, expected_mg_queue, expected_mg_levels, fresh_account
+from _output_fixture import buffered_output
 
+@buffered_output
 def test_global_martingale_logic():
     """Test the global Martingale system logic"""
     print("Testing Global Queue-Based Martingale System Logic")
     print("=" * 60)
     
     # Initialize with 2.5x multiplier (same as bot.py)
-    detectsignal.initialize_martingale_system(2.5, enabled=True)
+    fresh_account(detectsignal, mult=2.5)
     
     # Test initial state
     status = detectsignal.get_current_martingale_status()
@@ -26,7 +32,7 @@ def test_global_martingale_logic():
     assert status['queue_length'] == 0
     
     # Simulate first trade
-    amount1 = detectsignal._get_trade_amount_for_new_signal()
+    amount1 = detectsignal._get_trade_amount_for_new_signal(WORKER)
     print(f"First trade amount: ${amount1}")
     assert amount1 == 1.0
     
@@ -39,7 +45,7 @@ def test_global_martingale_logic():
     assert status['queued_amounts'][0] == 2.5  # 1.0 * 2.5^1
     
     # Get next trade amount (should come from queue)
-    amount2 = detectsignal._get_trade_amount_for_new_signal()
+    amount2 = detectsignal._get_trade_amount_for_new_signal(WORKER)
     print(f"Second trade amount: ${amount2}")
     assert amount2 == 2.5
     
@@ -56,30 +62,32 @@ def test_global_martingale_logic():
     
     print("✅ Global Martingale basic tests passed!")
 
+@buffered_output
 def test_concurrent_trades_scenario():
     """Test concurrent trades and queue management"""
     print("\nTesting Concurrent Trades Scenario")
     print("=" * 60)
     
     # Clear previous state
-    detectsignal._consecutive_losses = 0
-    detectsignal._martingale_queue.clear()
-    detectsignal._active_trades_count = 0
+    fresh_account(detectsignal, mult=2.5)
     
     # Simulate multiple signals arriving quickly
     print("📡 Signals arriving rapidly...")
+    _get_amt = detectsignal._get_trade_amount_for_new_signal
     amounts = []
     for i in range(3):
-        amount = detectsignal._get_trade_amount_for_new_signal()
+        amount = _get_amt(WORKER)
         amounts.append(amount)
+        detectsignal._track_pending_trade(f"trade_{i+1}", f"PAIR{i+1}", amount, worker_name=WORKER)
         print(f"Signal {i+1}: ${amount}")
     
     # All should be $1.00 initially (no losses yet)
     assert all(amount == 1.0 for amount in amounts)
     
+    # Open trades are tracked in the pending-results table until their result arrives
     status = detectsignal.get_current_martingale_status()
-    print(f"Status after 3 concurrent signals: Active trades: {status['active_trades_count']}")
-    assert status['active_trades_count'] == 3
+    print(f"Status after 3 concurrent signals: Pending trades: {status['pending_trades']}")
+    assert status['pending_trades'] == 3
     
     # First two trades lose
     print("\n💥 First two trades lose...")
@@ -90,13 +98,12 @@ def test_concurrent_trades_scenario():
     print(f"After 2 losses: Consecutive losses: {status['consecutive_losses']}, Queue: {status['queued_amounts']}")
     assert status['consecutive_losses'] == 2
     assert status['queue_length'] == 2
-    assert status['queued_amounts'][0] == 2.5   # First queued amount
-    assert status['queued_amounts'][1] == 6.25  # Second queued amount (2.5^2)
+    assert status['queued_amounts'] == expected_mg_queue(1.0, 2.5, 2)  # 2.5, then 2.5^2
     
     # Two new signals arrive - should use queued amounts
     print("\n📡 Two new signals arrive...")
-    amount_new1 = detectsignal._get_trade_amount_for_new_signal()
-    amount_new2 = detectsignal._get_trade_amount_for_new_signal()
+    amount_new1 = detectsignal._get_trade_amount_for_new_signal(WORKER)
+    amount_new2 = detectsignal._get_trade_amount_for_new_signal(WORKER)
     print(f"New signal 1: ${amount_new1}")
     print(f"New signal 2: ${amount_new2}")
     
@@ -109,20 +116,19 @@ def test_concurrent_trades_scenario():
     
     print("✅ Concurrent trades test passed!")
 
+@buffered_output
 def test_martingale_enable_disable():
     """Test enabling and disabling Martingale system"""
     print("\nTesting Martingale Enable/Disable")
     print("=" * 60)
     
     # Clear previous state
-    detectsignal._consecutive_losses = 0
-    detectsignal._martingale_queue.clear()
-    detectsignal._active_trades_count = 0
+    fresh_account(detectsignal, mult=2.5)
     
     # Test with Martingale enabled
     detectsignal.set_martingale_enabled(True)
     
-    amount_enabled = detectsignal._get_trade_amount_for_new_signal()
+    amount_enabled = detectsignal._get_trade_amount_for_new_signal(WORKER)
     print(f"Amount with Martingale ENABLED: ${amount_enabled}")
     assert amount_enabled == 1.0
     
@@ -135,7 +141,7 @@ def test_martingale_enable_disable():
     
     # Disable Martingale
     detectsignal.set_martingale_enabled(False)
-    amount_disabled = detectsignal._get_trade_amount_for_new_signal()
+    amount_disabled = detectsignal._get_trade_amount_for_new_signal(WORKER)
     print(f"Amount with Martingale DISABLED: ${amount_disabled}")
     assert amount_disabled == 1.0  # Should always be default when disabled
     
@@ -148,24 +154,24 @@ def test_martingale_enable_disable():
     
     # Re-enable and check if state is preserved
     detectsignal.set_martingale_enabled(True)
-    amount_from_queue = detectsignal._get_trade_amount_for_new_signal()
+    amount_from_queue = detectsignal._get_trade_amount_for_new_signal(WORKER)
     print(f"Amount after re-enabling (from queue): ${amount_from_queue}")
     assert amount_from_queue == 2.5  # Should use the queued amount
     
     print("✅ Enable/Disable test passed!")
 
+@buffered_output
 def test_mixed_results_scenario():
     """Test mixed win/loss scenarios"""
     print("\nTesting Mixed Results Scenario")
     print("=" * 60)
     
     # Clear previous state
-    detectsignal._consecutive_losses = 0
-    detectsignal._martingale_queue.clear()
-    detectsignal._active_trades_count = 0
+    fresh_account(detectsignal, mult=2.5)
     
     # Start with 3 trades
-    amounts = [detectsignal._get_trade_amount_for_new_signal() for _ in range(3)]
+    _get_amt = detectsignal._get_trade_amount_for_new_signal
+    amounts = [_get_amt(WORKER) for _ in range(3)]
     print(f"Started 3 trades: {amounts}")
     
     # 2 lose, 1 wins
@@ -179,17 +185,33 @@ def test_mixed_results_scenario():
     assert status['queue_length'] == 0       # Cleared by win
     
     # Next trade should be fresh
-    next_amount = detectsignal._get_trade_amount_for_new_signal()
+    next_amount = detectsignal._get_trade_amount_for_new_signal(WORKER)
     print(f"Next trade after win: ${next_amount}")
     assert next_amount == 1.0
     
     print("✅ Mixed results test passed!")
 
+@buffered_output
+def test_level_table_geometric_series():
+    """Test the precomputed Martingale level table against a NumPy geometric series"""
+    print("\nTesting Martingale Level Table")
+    print("=" * 60)
+    
+    levels = detectsignal._mart_levels(1.0, 2.5)
+    expected = expected_mg_levels(1.0, 2.5, len(levels))
+    print(f"First levels: {levels[:4]}")
+    
+    # Table entries are rounded to cents like every other trade amount
+    assert all(isclose(got, want, abs_tol=0.01) for got, want in zip(levels, expected))
+    
+    print("✅ Level table test passed!")
+
 if __name__ == "__main__":
     test_global_martingale_logic()
     test_concurrent_trades_scenario()
     test_martingale_enable_disable()
     test_mixed_results_scenario()
+    test_level_table_geometric_series()
     
     print("\n🎉 All Global Queue-Based Martingale Tests Passed!")
     print("\nFeatures tested:")
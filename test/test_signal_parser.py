@@ -4,15 +4,21 @@ Test script to verify signal parsing for Pocket Option Official Signal Bot forma
 """
 
 import sys
-import os
+from pathlib import Path
 import re
 
 # Add parent directory to path to import detectsignal
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+project_root = str(Path(__file__).resolve().parents[1])
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 # Import the signal parsing function
+import detectsignal
 from detectsignal import parse_signal_from_message, _normalize_pair_for_new_format
+from signal_text import scan_pocket_signal
+from _output_fixture import buffered_output
 
+@buffered_output
 def test_pocket_signal_parser():
     """Test the signal parser with real Pocket Option bot messages"""
     
@@ -75,9 +81,18 @@ Auto-trade: On"""
         print(f"   Expiration: {result_up['expiration']} seconds ({result_up['expiration']//60} minutes)")
     else:
         print("❌ UP SIGNAL PARSING FAILED!")
-    
+
+    # A repeated message is served from the parse cache but must still be a fresh dict
+    result_again = parse_signal_from_message(test_message)
+    if result_again == result and result_again is not result:
+        print("✅ Repeated message parsed identically from cache")
+    else:
+        print("❌ Repeated message parse mismatch!")
+        result = None
+
     return result is not None and result_up is not None
 
+@buffered_output
 def test_pair_normalization():
     """Test the pair normalization function"""
     print("\n🔧 Testing Pair Normalization")
@@ -95,6 +110,45 @@ def test_pair_normalization():
         normalized = _normalize_pair_for_new_format(pair)
         print(f"   {pair:15} → {normalized}")
 
+def _signal_engines():
+    """The regex engines the multi-line signal patterns can compile under: re, plus re2 when installed"""
+    engines = [re]
+    try:
+        import re2
+        engines.append(re2)
+    except ImportError:
+        pass
+    return engines
+
+@buffered_output
+def test_signal_patterns_match_under_each_engine():
+    """Both multi-line formats parse the same way under re and re2, with Unicode letters and NBSP"""
+    pocket_messages = [
+        "SIGNAL ⬆\n\nAsset: EURUSD_otc\nPayout: 88%\nExpiration: M1",
+        "SIGNAL ⬆\n\nAsset: ÉURUSD\nExpiration: M1",
+        "SIGNAL\xa0⬇\nAsset: EURUSD_otc\nPayout: 92%\nExpiration:\xa0M5",
+    ]
+    twsbinary_messages = [
+        ("🟢 CALL Signal on USDCADm\nPrice: 1.3650\nExpiration: 5 minutes", ('CALL', 'USDCADm', '5', 'minute')),
+        ("🔴 PUT Signal on EURUSD\nExpiration:\xa05 minutes", ('PUT', 'EURUSD', '5', 'minute')),
+    ]
+    
+    for message in pocket_messages:
+        # A header line in front sends the message past the line scan to the regex; the result must not change
+        assert parse_signal_from_message(message) is not None
+        assert parse_signal_from_message("Intro\n" + message) == parse_signal_from_message(message)
+    
+    for engine in _signal_engines():
+        print(f"   Engine: {engine.__name__}")
+        pocket_re = detectsignal._compile_signal_pattern(detectsignal._POCKET_SIGNAL_PATTERN, engine)
+        twsbinary_re = detectsignal._compile_signal_pattern(detectsignal._TWSBINARY_SIGNAL_PATTERN, engine)
+        
+        for message in pocket_messages:
+            direction, asset, minutes = scan_pocket_signal(message)
+            assert pocket_re.search("Intro\n" + message).groups() == (direction, asset, str(minutes))
+        for message, expected in twsbinary_messages:
+            assert twsbinary_re.search(message).groups() == expected
+
 def main():
     print("🎯 Pocket Option Signal Parser Tests")
     print("=" * 60)
@@ -6,12 +6,18 @@ Verifies that trade results reach the Martingale system correctly
 
 import time
 import sys
-import os
+from math import isclose
+from pathlib import Path
 
 # Add the project root to Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
+project_root = str(Path(__file__).resolve().parents[1])
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
+from _martingale_fixture import WORKER, expected_mg_queue, fresh_account
+from _output_fixture import buffered_output
+
+@buffered_output
 def test_trade_result_feedback():
     """Test that trade results update Martingale correctly"""
     print("🧪 Testing Trade Result Feedback to Martingale System")
@@ -27,7 +33,7 @@ def test_trade_result_feedback():
     print("📋 Initializing Martingale system...")
     
     # Initialize with test settings
-    detectsignal.initialize_martingale_system(martingale_multiplier=2.0, enabled=True)
+    fresh_account(detectsignal, mult=2.0)
     
     # Check initial status
     initial_status = detectsignal.get_current_martingale_status()
@@ -35,10 +41,10 @@ def test_trade_result_feedback():
     
     # Test 1: Get first trade amount (should be base amount)
     print("\n🎯 Test 1: First trade amount")
-    amount1 = detectsignal._get_trade_amount_for_new_signal()
+    amount1 = detectsignal._get_trade_amount_for_new_signal(WORKER)
     print(f"   First trade amount: ${amount1:.2f}")
     
-    if abs(amount1 - 1.0) < 0.01:  # DEFAULT_TRADE_AMOUNT is 1.0
+    if isclose(amount1, 1.0, abs_tol=0.01):  # DEFAULT_TRADE_AMOUNT is 1.0
         print("   ✅ First trade amount correct")
     else:
         print(f"   ❌ First trade amount incorrect (expected $1.00)")
@@ -48,11 +54,7 @@ def test_trade_result_feedback():
     trade_id = "test_trade_001"
     
     # Add to pending trades (simulate trade placement)
-    detectsignal._pending_trade_results[trade_id] = {
-        'symbol': 'EURUSD_otc',
-        'amount': amount1
-    }
-    detectsignal._active_trades_count += 1
+    detectsignal._track_pending_trade(trade_id, 'EURUSD_otc', amount1, worker_name=WORKER)
     
     # Handle loss result
     detectsignal._handle_trade_result(trade_id, 'EURUSD_otc', 'loss', -amount1)
@@ -63,13 +65,13 @@ def test_trade_result_feedback():
     
     # Test 3: Next trade should use Martingale amount
     print("\n📈 Test 3: Next trade with Martingale")
-    amount2 = detectsignal._get_trade_amount_for_new_signal()
-    expected_amount2 = 1.0 * 2.0  # base * multiplier
+    amount2 = detectsignal._get_trade_amount_for_new_signal(WORKER)
+    expected_amount2, expected_amount3 = expected_mg_queue(1.0, 2.0, 2)  # base * multiplier, base * multiplier^2
     
     print(f"   Second trade amount: ${amount2:.2f}")
     print(f"   Expected amount: ${expected_amount2:.2f}")
     
-    if abs(amount2 - expected_amount2) < 0.01:
+    if isclose(amount2, expected_amount2, abs_tol=0.01):
         print("   ✅ Martingale amount correct")
     else:
         print(f"   ❌ Martingale amount incorrect")
@@ -78,11 +80,7 @@ def test_trade_result_feedback():
     print("\n💥 Test 4: Another loss")
     trade_id2 = "test_trade_002"
     
-    detectsignal._pending_trade_results[trade_id2] = {
-        'symbol': 'GBPUSD_otc',
-        'amount': amount2
-    }
-    detectsignal._active_trades_count += 1
+    detectsignal._track_pending_trade(trade_id2, 'GBPUSD_otc', amount2, worker_name=WORKER)
     
     detectsignal._handle_trade_result(trade_id2, 'GBPUSD_otc', 'loss', -amount2)
     
@@ -91,13 +89,12 @@ def test_trade_result_feedback():
     
     # Test 5: Third trade amount
     print("\n📈 Test 5: Third trade amount")
-    amount3 = detectsignal._get_trade_amount_for_new_signal()
-    expected_amount3 = 1.0 * (2.0 ** 2)  # base * multiplier^2
+    amount3 = detectsignal._get_trade_amount_for_new_signal(WORKER)
     
     print(f"   Third trade amount: ${amount3:.2f}")
     print(f"   Expected amount: ${expected_amount3:.2f}")
     
-    if abs(amount3 - expected_amount3) < 0.01:
+    if isclose(amount3, expected_amount3, abs_tol=0.01):
         print("   ✅ Second Martingale amount correct")
     else:
         print(f"   ❌ Second Martingale amount incorrect")
@@ -106,11 +103,7 @@ def test_trade_result_feedback():
     print("\n🎯 Test 6: Win resets system")
     trade_id3 = "test_trade_003"
     
-    detectsignal._pending_trade_results[trade_id3] = {
-        'symbol': 'BITCOIN_otc',
-        'amount': amount3
-    }
-    detectsignal._active_trades_count += 1
+    detectsignal._track_pending_trade(trade_id3, 'BITCOIN_otc', amount3, worker_name=WORKER)
     
     detectsignal._handle_trade_result(trade_id3, 'BITCOIN_otc', 'win', amount3 * 1.8)
     
@@ -119,12 +112,12 @@ def test_trade_result_feedback():
     
     # Test 7: Next trade should be back to base
     print("\n🔄 Test 7: Reset to base amount")
-    amount4 = detectsignal._get_trade_amount_for_new_signal()
+    amount4 = detectsignal._get_trade_amount_for_new_signal(WORKER)
     
     print(f"   Fourth trade amount: ${amount4:.2f}")
     print(f"   Expected (base): $1.00")
     
-    if abs(amount4 - 1.0) < 0.01:
+    if isclose(amount4, 1.0, abs_tol=0.01):
         print("   ✅ Reset to base amount correct")
     else:
         print(f"   ❌ Reset incorrect")
@@ -6,8 +6,17 @@ This script will help you authenticate your Telegram account with 2FA enabled.
 
 import asyncio
 import os
+import sys
+from pathlib import Path
 from telethon import TelegramClient
 
+project_root = str(Path(__file__).resolve().parents[1])
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Same 2FA check as detectsignal's sign-in flow
+from signal_text import TWO_FACTOR_HINT_RE as _TWO_FACTOR_HINT_RE
+
 # Your account configuration (from detectsignal.py)
 API_ID = '23324590'
 API_HASH = 'fdcd53d426aebd07096ff326bb124397'
@@ -18,9 +27,7 @@ TARGET_BOT_ID = 1385109737  # Pocket Option Official Signal Bot
 async def test_auth():
     # Ensure session directory exists
     session_folder = "../telegram_sessions"
-    if not os.path.exists(session_folder):
-        os.makedirs(session_folder)
-        print(f"Created directory: {session_folder}")
+    os.makedirs(session_folder, exist_ok=True)
     
     full_session_path = os.path.join(session_folder, SESSION_NAME)
     
@@ -46,7 +53,7 @@ async def test_auth():
                     print(f"❌ Sign-in error: {e}")
                     
                     # Enhanced 2FA detection
-                    if any(keyword in error_str for keyword in ['password', 'two-factor', '2fa', 'two factor', 'cloud password']):
+                    if _TWO_FACTOR_HINT_RE.search(error_str):
                         try:
                             password = input(f"Enter your 2FA password for {PHONE_NUMBER}: ")
                             await client.sign_in(password=password)
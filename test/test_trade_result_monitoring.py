@@ -6,14 +6,19 @@ Tests the integration between PocketOption worker and Martingale system
 
 import time
 import threading
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 import sys
-import os
+from pathlib import Path
 
 # Add the project root to Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
+project_root = str(Path(__file__).resolve().parents[1])
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
+from _output_fixture import buffered_output
+
+@buffered_output
 def test_trade_result_integration():
     """Test complete trade result flow"""
     print("🧪 Testing Trade Result Monitoring Integration")
@@ -142,27 +147,55 @@ def test_trade_result_integration():
         print("✅ Timeout handled correctly (no Martingale update)")
         print()
 
+class _FakePocketOption:
+    """Stand-in for PocketOption: check_win reports pending twice, then a win"""
+    def __init__(self, *args, **kwargs):
+        self._results = iter([
+            (None, "unknown"),  # Still pending
+            (None, "unknown"),  # Still pending
+            (1.75, "win")       # Trade completed with win
+        ])
+
+    def check_win(self, trade_id):
+        return next(self._results)
+
+class _CaptureQueue:
+    """Stand-in for the worker's response queue that keeps everything put on it"""
+    def __init__(self):
+        self.items = []
+
+    def put(self, response):
+        self.items.append(response)
+        print(f"📤 Response queued: {response}")
+
+@buffered_output
 def test_worker_monitoring_logic():
     """Test the worker monitoring action logic"""
     print("🔧 Testing Worker Monitor Trade Action")
     print("=" * 60)
     
-    # Mock the PocketOption API
-    with patch('worker.PocketOption') as MockPocketOption:
+    # Swap in plain stubs for the PocketOption API and connection state
+    with patch('worker.PocketOption', _FakePocketOption):
         
-        # Create mock API instance
-        mock_api = Mock()
-        MockPocketOption.return_value = mock_api
+        mock_api = _FakePocketOption()
         
-        # Setup mock connection
-        with patch('worker.global_value') as mock_global_value:
-            mock_global_value.websocket_is_connected = True
-            mock_global_value.logger = lambda msg, level="INFO": print(f"[WORKER][{level}] {msg}")
+        fake_global_value = SimpleNamespace(
+            websocket_is_connected=True,
+            logger=lambda msg, level="INFO": print(f"[WORKER][{level}] {msg}")
+        )
+        with patch('worker.global_value', fake_global_value):
+            
+            # Virtual clock: the loop's sleeps advance fake_now instead of blocking
+            fake_now = [time.time()]
+            clock = lambda: fake_now[0]
+            
+            def sleeper(seconds):
+                fake_now[0] += seconds
             
             # Test parameters
             test_params = {
                 'trade_id': 'test_trade_123',
-                'expiration_time': time.time() + 60,
+                'expiration_time': clock() + 60,
                 'symbol': 'EURUSD_otc'
             }
             
@@ -172,24 +205,9 @@ def test_worker_monitoring_logic():
             print("3. Sends result back to main process")
             print()
             
-            # Setup mock check_win responses
-            # First few calls return unknown, then win
-            mock_api.check_win.side_effect = [
-                (None, "unknown"),  # Still pending
-                (None, "unknown"),  # Still pending
-                (1.75, "win")       # Trade completed with win
-            ]
-            
-            # Mock queues
-            from unittest.mock import Mock as MockQueue
-            response_queue = MockQueue()
-            captured_responses = []
-            
-            def capture_response(response):
-                captured_responses.append(response)
-                print(f"📤 Response queued: {response}")
-            
-            response_queue.put = capture_response
+            # check_win returns unknown for the first few calls, then win (see _FakePocketOption)
+            response_queue = _CaptureQueue()
+            captured_responses = response_queue.items
             
             print("🎬 Simulating monitor_trade action...")
             print(f"   Trade ID: {test_params['trade_id']}")
@@ -214,10 +232,10 @@ def test_worker_monitoring_logic():
             
             # Simulate monitoring loop (shortened for test)
             monitor_timeout = expiration_time + 30
-            start_time = time.time()
+            start_time = clock()
             check_count = 0
             
-            while time.time() < monitor_timeout and check_count < 3:  # Limit for test
+            while clock() < monitor_timeout and check_count < 3:  # Limit for test
                 try:
                     profit, status = mock_api.check_win(trade_id)
                     check_count += 1
@@ -233,7 +251,7 @@ def test_worker_monitoring_logic():
                                 'symbol': symbol,
                                 'profit': profit,
                                 'result': status,
-                                'monitoring_duration': time.time() - start_time
+                                'monitoring_duration': clock() - start_time
                             }
                         }
                         response_queue.put(result_response)
@@ -243,7 +261,7 @@ def test_worker_monitoring_logic():
                 except Exception as e:
                     print(f"   ❌ Error: {e}")
                 
-                time.sleep(0.1)  # Short sleep for test
+                sleeper(0.1)  # Same cadence as before, without the wall-clock wait
             
             print()
             print("📊 Results Summary:")
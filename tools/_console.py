@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Shared console-output helper for the command-line tools and the test scripts.
+"""
+
+import functools
+import io
+import sys
+from contextlib import redirect_stdout
+
+def buffered_output(func):
+    """Collect everything a report function prints and write it to stdout in one call when it finishes.
+    Only for non-interactive output: anything printed before an input() prompt would be held back."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        buf = io.StringIO()
+        try:
+            with redirect_stdout(buf):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
+    return wrapper
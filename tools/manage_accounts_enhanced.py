@@ -4,14 +4,44 @@ Enhanced Account Management CLI
 Manage PocketOption trading accounts with Martingale settings
 """
 
+from __future__ import annotations
+
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-from db.database_manager import DatabaseManager
+from typing import TYPE_CHECKING, Optional
+if TYPE_CHECKING:
+    # Only for annotations; main() imports it once an action actually needs the database
+    from db.database_manager import DatabaseManager
+from tools._console import buffered_output
 import argparse
-from typing import Optional
+import csv
+import shlex
+
+# Account table layout, built once
+_HEADER = f"{'Name':<20} {'SSID':<25} {'Demo':<6} {'Enabled':<8} {'Balance':<10} {'Base $':<8} {'Mult':<6} {'Mart':<6}"
+_SEP = "-" * 90
+# Named fields over the account row; the .19/.24 precisions truncate long names like [:19]/[:24]
+_ROW_FMT = ("{worker_name:<20.19} {ssid:<25.24} {is_demo_s:<6} {enabled_s:<8} ${balance:<9.2f} "
+            "${base_amount:<7.2f} {multiplier_s:<6} {martingale_enabled_s:<6}")
+_YN = ('No', 'Yes')
+
+# Accepted answers for yes/no prompts and CSV flags
+_YES = frozenset({'y', 'yes', '1', 'true'})
+_NO = frozenset({'n', 'no', '0', 'false'})
+
+def _martingale_settings(acc: dict) -> dict:
+    """Martingale settings from an already-loaded accounts row (same coercion as get_account_martingale_settings)"""
+    return {
+        'base_amount': float(acc['base_amount']) if acc['base_amount'] else 1.00,
+        'martingale_multiplier': float(acc['martingale_multiplier']) if acc['martingale_multiplier'] else 2.00,
+        'martingale_enabled': bool(acc['martingale_enabled']) if acc['martingale_enabled'] is not None else True
+    }
 
+@buffered_output
 def display_accounts(dm: DatabaseManager, enabled_only: bool = False):
     """Display all accounts with their settings"""
     accounts = dm.get_enabled_accounts() if enabled_only else dm.get_all_accounts()
@@ -24,21 +54,18 @@ def display_accounts(dm: DatabaseManager, enabled_only: bool = False):
     print(f"{'ACCOUNT MANAGEMENT' if not enabled_only else 'ENABLED ACCOUNTS'}")
     print(f"{'='*90}")
     
-    header = f"{'Name':<20} {'SSID':<25} {'Demo':<6} {'Enabled':<8} {'Balance':<10} {'Base $':<8} {'Mult':<6} {'Mart':<6}"
-    print(header)
-    print("-" * 90)
+    print(_HEADER)
+    print(_SEP)
     
+    # Rows come from the fixed column list in get_all_accounts/get_enabled_accounts, so every key is present
     for acc in accounts:
-        name = acc.get('worker_name', '')[:19]
-        ssid = acc.get('ssid', '')[:24]
-        is_demo = 'Yes' if acc.get('is_demo') else 'No'
-        enabled = 'Yes' if acc.get('enabled') else 'No'
-        balance = f"${acc.get('balance', 0):.2f}"
-        base_amount = f"${acc.get('base_amount', 1.0):.2f}"
-        multiplier = f"{acc.get('martingale_multiplier', 2.0):.1f}x"
-        mart_enabled = 'Yes' if acc.get('martingale_enabled') else 'No'
-        
-        print(f"{name:<20} {ssid:<25} {is_demo:<6} {enabled:<8} {balance:<10} {base_amount:<8} {multiplier:<6} {mart_enabled:<6}")
+        print(_ROW_FMT.format_map({
+            **acc,
+            'is_demo_s': _YN[bool(acc['is_demo'])],
+            'enabled_s': _YN[bool(acc['enabled'])],
+            'multiplier_s': f"{acc['martingale_multiplier']:.1f}x",
+            'martingale_enabled_s': _YN[bool(acc['martingale_enabled'])]
+        }))
     
     print(f"\nTotal accounts: {len(accounts)}")
 
@@ -59,10 +86,10 @@ def add_account_interactive(dm: DatabaseManager):
         return False
     
     is_demo_input = input("Is demo account? (y/N): ").strip().lower()
-    is_demo = is_demo_input in ['y', 'yes', '1', 'true']
+    is_demo = is_demo_input in _YES
     
     enabled_input = input("Enable account? (Y/n): ").strip().lower()
-    enabled = enabled_input not in ['n', 'no', '0', 'false']
+    enabled = enabled_input not in _NO
     
     # Martingale settings
     print("\n--- Martingale Settings ---")
@@ -82,7 +109,7 @@ def add_account_interactive(dm: DatabaseManager):
         print("Invalid multiplier, using 2.0x")
     
     mart_enabled_input = input("Enable Martingale? (Y/n): ").strip().lower()
-    martingale_enabled = mart_enabled_input not in ['n', 'no', '0', 'false']
+    martingale_enabled = mart_enabled_input not in _NO
     
     try:
         balance_input = input("Initial balance ($0.00): ").strip()
@@ -95,15 +122,15 @@ def add_account_interactive(dm: DatabaseManager):
     print("\n--- Confirm Account Settings ---")
     print(f"Name: {worker_name}")
     print(f"SSID: {ssid}")
-    print(f"Demo: {'Yes' if is_demo else 'No'}")
-    print(f"Enabled: {'Yes' if enabled else 'No'}")
+    print(f"Demo: {_YN[bool(is_demo)]}")
+    print(f"Enabled: {_YN[bool(enabled)]}")
     print(f"Balance: ${balance:.2f}")
     print(f"Base Amount: ${base_amount:.2f}")
     print(f"Multiplier: {martingale_multiplier:.1f}x")
-    print(f"Martingale Enabled: {'Yes' if martingale_enabled else 'No'}")
+    print(f"Martingale Enabled: {_YN[bool(martingale_enabled)]}")
     
     confirm = input("\nCreate account with these settings? (Y/n): ").strip().lower()
-    if confirm in ['n', 'no', '0', 'false']:
+    if confirm in _NO:
         print("Account creation cancelled.")
         return False
     
@@ -126,6 +153,93 @@ def add_account_interactive(dm: DatabaseManager):
         print(f"\n❌ Failed to create account '{worker_name}'")
         return False
 
+def _parse_flag(value, default: bool) -> bool:
+    """y/yes/1/true or n/no/0/false from a CSV cell; blank or missing keeps the default"""
+    value = (value or '').strip().lower()
+    if not value:
+        return default
+    if value in _YES:
+        return True
+    if value in _NO:
+        return False
+    raise ValueError(f"Invalid yes/no value: {value!r}")
+
+def _csv_row_to_account(row: dict) -> dict:
+    """add_account keyword arguments for one CSV row (only worker_name and ssid are required)"""
+    worker_name = (row.get('worker_name') or '').strip()
+    ssid = (row.get('ssid') or '').strip()
+    if not worker_name or not ssid:
+        raise ValueError("worker_name and ssid are required")
+    return {
+        'worker_name': worker_name,
+        'ssid': ssid,
+        'is_demo': _parse_flag(row.get('is_demo'), False),
+        'enabled': _parse_flag(row.get('enabled'), True),
+        'balance': float(row.get('balance') or 0.00),
+        'base_amount': float(row.get('base_amount') or 1.00),
+        'martingale_multiplier': float(row.get('martingale_multiplier') or 2.00),
+        'martingale_enabled': _parse_flag(row.get('martingale_enabled'), True)
+    }
+
+def add_accounts_from_csv(dm: DatabaseManager, csv_path: str):
+    """Add/update every account in a CSV file (header row with add_account's field names) in one batch"""
+    try:
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            rows = []
+            # Data starts on line 2, after the header
+            for line_no, row in enumerate(csv.DictReader(f), 2):
+                try:
+                    rows.append(_csv_row_to_account(row))
+                except ValueError as e:
+                    print(f"Error: {csv_path} line {line_no}: {e}")
+                    return False
+    except OSError as e:
+        print(f"Error: Could not read {csv_path}: {e}")
+        return False
+    
+    if not rows:
+        print(f"No accounts found in {csv_path}.")
+        return False
+    
+    if dm.add_accounts_bulk(rows):
+        print(f"\n✅ {len(rows)} accounts added/updated from {csv_path}")
+        return True
+    else:
+        print(f"\n❌ Failed to add accounts from {csv_path}")
+        return False
+
+def add_account_from_args(dm: DatabaseManager, args: argparse.Namespace):
+    """Add account from command-line flags, without prompting"""
+    if not args.name or not args.ssid:
+        print("Error: --name and --ssid are both required to add an account non-interactively")
+        return False
+    
+    success = dm.add_account(
+        worker_name=args.name,
+        ssid=args.ssid,
+        is_demo=args.demo,
+        enabled=not args.disabled,
+        balance=args.balance,
+        base_amount=args.base_amount,
+        martingale_multiplier=args.multiplier,
+        martingale_enabled=not args.no_martingale
+    )
+    
+    if success:
+        print(f"\n✅ Account '{args.name}' created successfully!")
+        return True
+    else:
+        print(f"\n❌ Failed to create account '{args.name}'")
+        return False
+
+def add_account_command(dm: DatabaseManager, args: argparse.Namespace):
+    """'add' action: CSV import, flag-driven add, or the interactive prompts when neither is given"""
+    if args.from_csv:
+        return add_accounts_from_csv(dm, args.from_csv)
+    if args.name or args.ssid:
+        return add_account_from_args(dm, args)
+    return add_account_interactive(dm)
+
 def update_martingale_settings_interactive(dm: DatabaseManager):
     """Update Martingale settings for an account"""
     print("\n" + "="*50)
@@ -140,9 +254,9 @@ def update_martingale_settings_interactive(dm: DatabaseManager):
     
     print("\nAvailable accounts:")
     for i, acc in enumerate(accounts, 1):
-        print(f"{i}. {acc['worker_name']} (Base: ${acc.get('base_amount', 'N/A')}, "
-              f"Mult: {acc.get('martingale_multiplier', 'N/A')}x, "
-              f"Enabled: {'Yes' if acc.get('martingale_enabled') else 'No'})")
+        print(f"{i}. {acc['worker_name']} (Base: ${acc['base_amount']}, "
+              f"Mult: {acc['martingale_multiplier']}x, "
+              f"Enabled: {_YN[bool(acc['martingale_enabled'])]})")
     
     try:
         choice = int(input(f"\nSelect account (1-{len(accounts)}): ")) - 1
@@ -160,16 +274,13 @@ def update_martingale_settings_interactive(dm: DatabaseManager):
     print(f"\nUpdating Martingale settings for: {worker_name}")
     print("Leave blank to keep current value")
     
-    # Get current settings
-    current_settings = dm.get_account_martingale_settings(worker_name)
-    if not current_settings:
-        print("Failed to get current settings.")
-        return False
+    # Current settings come from the row already loaded above, no second SELECT
+    current_settings = _martingale_settings(selected_account)
     
     print(f"\nCurrent settings:")
     print(f"Base Amount: ${current_settings['base_amount']:.2f}")
     print(f"Multiplier: {current_settings['martingale_multiplier']:.1f}x")
-    print(f"Enabled: {'Yes' if current_settings['martingale_enabled'] else 'No'}")
+    print(f"Enabled: {_YN[bool(current_settings['martingale_enabled'])]}")
     
     # Get new values
     new_base = None
@@ -194,9 +305,9 @@ def update_martingale_settings_interactive(dm: DatabaseManager):
     
     enabled_input = input(f"Enable Martingale? y/n (current: {'y' if current_settings['martingale_enabled'] else 'n'}): ").strip().lower()
     if enabled_input:
-        if enabled_input in ['y', 'yes', '1', 'true']:
+        if enabled_input in _YES:
             new_enabled = True
-        elif enabled_input in ['n', 'no', '0', 'false']:
+        elif enabled_input in _NO:
             new_enabled = False
         else:
             print("Invalid enabled value (use y/n).")
@@ -217,13 +328,18 @@ def update_martingale_settings_interactive(dm: DatabaseManager):
     if success:
         print(f"\n✅ Martingale settings updated for '{worker_name}'!")
         
-        # Show updated settings
-        updated_settings = dm.get_account_martingale_settings(worker_name)
-        if updated_settings:
-            print(f"\nUpdated settings:")
-            print(f"Base Amount: ${updated_settings['base_amount']:.2f}")
-            print(f"Multiplier: {updated_settings['martingale_multiplier']:.1f}x")
-            print(f"Enabled: {'Yes' if updated_settings['martingale_enabled'] else 'No'}")
+        # Show updated settings (overlay what was just written instead of re-reading it)
+        updated_settings = dict(current_settings)
+        if new_base is not None:
+            updated_settings['base_amount'] = new_base
+        if new_multiplier is not None:
+            updated_settings['martingale_multiplier'] = new_multiplier
+        if new_enabled is not None:
+            updated_settings['martingale_enabled'] = new_enabled
+        print(f"\nUpdated settings:")
+        print(f"Base Amount: ${updated_settings['base_amount']:.2f}")
+        print(f"Multiplier: {updated_settings['martingale_multiplier']:.1f}x")
+        print(f"Enabled: {_YN[bool(updated_settings['martingale_enabled'])]}")
         
         return True
     else:
@@ -271,23 +387,95 @@ def toggle_account_status(dm: DatabaseManager):
         print("Invalid selection.")
         return False
 
-def main():
-    """Main CLI interface"""
+# Action name -> handler taking the open DatabaseManager and the parsed arguments
+_ACTIONS = {
+    'list': lambda dm, args: display_accounts(dm, enabled_only=False),
+    'enabled': lambda dm, args: display_accounts(dm, enabled_only=True),
+    'add': add_account_command,
+    'martingale': lambda dm, args: update_martingale_settings_interactive(dm),
+    'toggle': lambda dm, args: toggle_account_status(dm),
+}
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Argument parser shared by the command line and the repl"""
     parser = argparse.ArgumentParser(
         description="Enhanced Account Management for PocketOption Trading Bot",
         formatter_class=argparse.RawTextHelpFormatter
     )
     
     parser.add_argument('action', nargs='?', choices=[
-        'list', 'enabled', 'add', 'martingale', 'toggle', 'help'
+        'list', 'enabled', 'add', 'martingale', 'toggle', 'repl', 'help'
     ], default='help', help="""Available actions:
   list      - Show all accounts with settings
   enabled   - Show only enabled accounts
-  add       - Add new account interactively
+  add       - Add new account (interactive, or with --name/--ssid or --from-csv)
   martingale- Update Martingale settings
   toggle    - Toggle account enabled/disabled
+  repl      - Keep one database connection open and run several actions
   help      - Show this help message""")
     
+    add_group = parser.add_argument_group('non-interactive add', 'Options for "add" that skip the prompts')
+    add_group.add_argument('--name', help='Account name/identifier')
+    add_group.add_argument('--ssid', help='SSID (email/login)')
+    add_group.add_argument('--demo', action='store_true', help='Mark the account as demo')
+    add_group.add_argument('--disabled', action='store_true', help='Create the account disabled')
+    add_group.add_argument('--balance', type=float, default=0.00, help='Initial balance (default: 0.00)')
+    add_group.add_argument('--base-amount', type=float, default=1.00, help='Base trade amount (default: 1.00)')
+    add_group.add_argument('--multiplier', type=float, default=2.00, help='Martingale multiplier (default: 2.0)')
+    add_group.add_argument('--no-martingale', action='store_true', help='Disable Martingale for the account')
+    add_group.add_argument('--from-csv', metavar='PATH',
+                           help='Add/update all accounts in a CSV file in one batch; header columns:\n'
+                                'worker_name,ssid[,is_demo,enabled,balance,base_amount,\n'
+                                'martingale_multiplier,martingale_enabled]')
+    return parser
+
+def repl(dm: DatabaseManager, parser: argparse.ArgumentParser):
+    """Read 'action [options]' lines and run them over the one open connection until quit/EOF"""
+    print("Account management shell - enter an action (e.g. 'list', 'add --name x --ssid y'), 'help' or 'quit'")
+    while True:
+        try:
+            line = input("\naccounts> ").strip()
+        except EOFError:
+            print()
+            break
+        except KeyboardInterrupt:
+            print()
+            continue
+        
+        if not line:
+            continue
+        if line in ('quit', 'exit'):
+            break
+        
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            # e.g. an unbalanced quote; argparse never sees the line
+            print(f"❌ Could not parse command: {e}")
+            continue
+        try:
+            args = parser.parse_args(argv)
+        except SystemExit:
+            # argparse has already printed the usage error (or its own help)
+            continue
+        
+        if args.action == 'help':
+            parser.print_help()
+            continue
+        if args.action == 'repl':
+            print("Already in the shell.")
+            continue
+        
+        try:
+            _ACTIONS[args.action](dm, args)
+        except KeyboardInterrupt:
+            print("\n🛑 Action cancelled")
+        except Exception as e:
+            print(f"\n❌ Error: {e}")
+
+def main():
+    """Main CLI interface"""
+    parser = _build_parser()
     args = parser.parse_args()
     
     if args.action == 'help':
@@ -296,6 +484,7 @@ def main():
     
     # Initialize database
     try:
+        from db.database_manager import DatabaseManager
         dm = DatabaseManager()
         print("✅ Connected to database successfully")
     except Exception as e:
@@ -304,20 +493,12 @@ def main():
     
     # Execute action
     try:
-        if args.action == 'list':
-            display_accounts(dm, enabled_only=False)
-        
-        elif args.action == 'enabled':
-            display_accounts(dm, enabled_only=True)
-        
-        elif args.action == 'add':
-            add_account_interactive(dm)
-        
-        elif args.action == 'martingale':
-            update_martingale_settings_interactive(dm)
-        
-        elif args.action == 'toggle':
-            toggle_account_status(dm)
+        if args.action == 'repl':
+            repl(dm, parser)
+        else:
+            action_fn = _ACTIONS.get(args.action)
+            if action_fn:
+                action_fn(dm, args)
         
     except KeyboardInterrupt:
         print("\n\n🛑 Operation cancelled by user")
@@ -4,42 +4,72 @@ Database Migration Utility
 Force run migrations and check database schema status
 """
 
+from __future__ import annotations
+
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-from db.database_manager import DatabaseManager
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    # Only for annotations; main() imports it once an action actually needs the database
+    from db.database_manager import DatabaseManager
+from tools._console import buffered_output
 import argparse
 
-def check_schema_status(dm: DatabaseManager):
-    """Check current database schema status"""
+# Column listing layout for check_schema_status, built once
+_COLUMN_HEADER = f"{'Column Name':<25} {'Type':<15} {'Nullable':<10} {'Default':<15}"
+_COLUMN_SEP = "-" * 70
+_COLUMN_FMT = "{:<25} {:<15} {:<10} {:<15}"
+
+@buffered_output
+def check_schema_status(dm: DatabaseManager, full: bool = False):
+    """Check current database schema status (column introspection only when the version differs, or with full=True)"""
     print("\n" + "="*60)
     print("DATABASE SCHEMA STATUS")
     print("="*60)
     
     try:
-        # Check accounts table columns
+        schema_version = dm.get_schema_version()
+        if schema_version == dm.SCHEMA_VERSION and not full:
+            print(f"\n✅ Schema up-to-date (version {schema_version}); use --full for the column listing")
+            return
+        print(f"\n📌 Schema version: {schema_version if schema_version is not None else 'not recorded'} "
+              f"(expected {dm.SCHEMA_VERSION})")
+        
+        # Fetch column metadata for both tables in one query and split it per table
         if dm.db_type == "mysql":
             query = """
-            SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE, COLUMN_DEFAULT
+            SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE, IS_NULLABLE, COLUMN_DEFAULT
             FROM INFORMATION_SCHEMA.COLUMNS 
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'accounts'
-            ORDER BY ORDINAL_POSITION
+            WHERE TABLE_SCHEMA = %s AND TABLE_NAME IN ('accounts', 'martingale_state')
+            ORDER BY TABLE_NAME, ORDINAL_POSITION
             """
             result = dm._execute_query(query, (dm.mysql_config.get('database', ''),), fetch="all")
-            columns_info = [(row[0], row[1], row[2], row[3]) for row in result] if result else []
         else:
-            query = "PRAGMA table_info(accounts)"
+            query = """
+            SELECT 'accounts', name, type, CASE WHEN "notnull" THEN 'NO' ELSE 'YES' END, dflt_value
+            FROM pragma_table_info('accounts')
+            UNION ALL
+            SELECT 'martingale_state', name, type, CASE WHEN "notnull" THEN 'NO' ELSE 'YES' END, dflt_value
+            FROM pragma_table_info('martingale_state')
+            """
             result = dm._execute_query(query, fetch="all")
-            columns_info = [(row[1], row[2], "YES" if not row[3] else "NO", row[4]) for row in result] if result else []
+        columns_by_table = {}
+        for row in result or ():
+            columns_by_table.setdefault(row[0], []).append(tuple(row[1:]))
+        
+        columns_info = columns_by_table.get('accounts', [])
         
         print("\n📋 ACCOUNTS TABLE COLUMNS:")
         if columns_info:
-            print(f"{'Column Name':<25} {'Type':<15} {'Nullable':<10} {'Default':<15}")
-            print("-" * 70)
+            print(_COLUMN_HEADER)
+            print(_COLUMN_SEP)
             for col_name, col_type, nullable, default in columns_info:
                 default_str = str(default) if default is not None else "NULL"
-                print(f"{col_name:<25} {col_type:<15} {nullable:<10} {default_str:<15}")
+                print(_COLUMN_FMT.format(col_name, col_type, nullable, default_str))
         else:
             print("❌ No accounts table found!")
         
@@ -53,19 +83,7 @@ def check_schema_status(dm: DatabaseManager):
             print(f"  {req_col:<25} {status}")
         
         # Check martingale_state table
-        if dm.db_type == "mysql":
-            query = """
-            SELECT COLUMN_NAME 
-            FROM INFORMATION_SCHEMA.COLUMNS 
-            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'martingale_state'
-            ORDER BY ORDINAL_POSITION
-            """
-            result = dm._execute_query(query, (dm.mysql_config.get('database', ''),), fetch="all")
-            mart_columns = [row[0] for row in result] if result else []
-        else:
-            query = "PRAGMA table_info(martingale_state)"
-            result = dm._execute_query(query, fetch="all")
-            mart_columns = [row[1] for row in result] if result else []
+        mart_columns = [col[0] for col in columns_by_table.get('martingale_state', [])]
         
         print(f"\n🔄 MARTINGALE_STATE TABLE:")
         if mart_columns:
@@ -99,17 +117,17 @@ def force_migration(dm: DatabaseManager):
     print("="*60)
     
     try:
-        print("🔄 Running schema migration check...")
+        # _check_and_migrate_schema finishes with _migrate_martingale_table, so one call covers both tables.
+        # The two must not run concurrently: DatabaseManager shares one connection across threads.
+        print("🔄 Running schema migration check (accounts + martingale_state)...")
         dm._check_and_migrate_schema()
         
-        print("🔄 Running Martingale table migration...")
-        dm._migrate_martingale_table()
-        
         print("✅ Force migration completed!")
         
     except Exception as e:
         print(f"❌ Migration failed: {e}")
 
+@buffered_output
 def reset_test_data(dm: DatabaseManager):
     """Reset and add test data"""
     print("\n" + "="*60)
@@ -157,9 +175,10 @@ def reset_test_data(dm: DatabaseManager):
             }
         ]
         
+        # One executemany + commit for the whole batch instead of a roundtrip per account
+        success = dm.add_accounts_bulk(test_data)
+        status = "✅" if success else "❌"
         for acc in test_data:
-            success = dm.add_account(**acc)
-            status = "✅" if success else "❌"
             print(f"  {status} {acc['worker_name']} - Base: ${acc['base_amount']}, Mult: {acc['martingale_multiplier']}x, Enabled: {acc['martingale_enabled']}")
         
         print("✅ Test data reset completed!")
@@ -167,6 +186,29 @@ def reset_test_data(dm: DatabaseManager):
     except Exception as e:
         print(f"❌ Test data reset failed: {e}")
 
+def run_standard_migration(dm: DatabaseManager):
+    """Standard migration already ran when the DatabaseManager was created; report and show status"""
+    print("🔄 Running standard migration...")
+    # Migration already ran during DatabaseManager initialization
+    print("✅ Standard migration completed!")
+    check_schema_status(dm)
+
+def _force_and_check(dm: DatabaseManager):
+    force_migration(dm)
+    check_schema_status(dm, full=True)
+
+def _reset_and_check(dm: DatabaseManager):
+    reset_test_data(dm)
+    check_schema_status(dm, full=True)
+
+# Action name -> handler taking the open DatabaseManager and the parsed arguments
+_ACTIONS = {
+    'status': lambda dm, args: check_schema_status(dm, full=args.full),
+    'migrate': lambda dm, args: run_standard_migration(dm),
+    'force': lambda dm, args: _force_and_check(dm),
+    'reset-test': lambda dm, args: _reset_and_check(dm),
+}
+
 def main():
     """Main migration utility"""
     parser = argparse.ArgumentParser(
@@ -182,6 +224,8 @@ def main():
   force     - Force run all migrations regardless of current state
   reset-test- Reset test account data with Martingale settings
   help      - Show this help message""")
+    parser.add_argument('--full', action='store_true',
+                        help='status: list table columns even when the recorded schema version is current')
     
     args = parser.parse_args()
     
@@ -192,6 +236,7 @@ def main():
     # Initialize database
     try:
         print("🔗 Connecting to database...")
+        from db.database_manager import DatabaseManager
         dm = DatabaseManager()
         print("✅ Connected successfully")
     except Exception as e:
@@ -200,22 +245,9 @@ def main():
     
     # Execute action
     try:
-        if args.action == 'status':
-            check_schema_status(dm)
-        
-        elif args.action == 'migrate':
-            print("🔄 Running standard migration...")
-            # Migration already ran during DatabaseManager initialization
-            print("✅ Standard migration completed!")
-            check_schema_status(dm)
-        
-        elif args.action == 'force':
-            force_migration(dm)
-            check_schema_status(dm)
-        
-        elif args.action == 'reset-test':
-            reset_test_data(dm)
-            check_schema_status(dm)
+        action_fn = _ACTIONS.get(args.action)
+        if action_fn:
+            action_fn(dm, args)
         
     except KeyboardInterrupt:
         print("\n\n🛑 Operation cancelled by user")
@@ -3,9 +3,17 @@ import time
 import math
 import json
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import numpy as np
 import pandas as pd
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional: without it the kernels below run as plain Python over the same arrays
+    def njit(*args, **kwargs):
+        return lambda func: func
 
 # Module-level placeholders to be initialized
 _api = None
@@ -17,6 +25,9 @@ _min_payout = None
 # _expiration is not directly used by the functions being moved,
 # but if any strategy needed it, it could be passed via initialize too.
 
+# Minimum spacing in seconds between the starts of two get_candles() requests in get_df()
+_CANDLES_MIN_INTERVAL = 0.2
+
 def initialize_pocket_functions(api_instance, global_value_module, qtpylib_module, ta_module, period_val, min_payout_val):
     """Initializes module-level variables for pocket_functions."""
     global _api, _global_value, _qtpylib, _ta, _period, _min_payout
@@ -54,12 +65,18 @@ def get_df():
             _global_value.logger("[PocketFunctions] API object not initialized in get_df. Cannot fetch candles.", "ERROR")
             return False
 
+        # get_candles() blocks on shared response slots of the one websocket, so fetches stay sequential;
+        # they are only spaced to _CANDLES_MIN_INTERVAL instead of idling a full second after each pair
         i = 0
+        last_request = 0.0
         for pair_name in _global_value.pairs: # Renamed 'pair' to 'pair_name'
             i += 1
+            pause = last_request + _CANDLES_MIN_INTERVAL - time.monotonic()
+            if pause > 0:
+                time.sleep(pause)
+            last_request = time.monotonic()
             df = _api.get_candles(pair_name, _period)
             _global_value.logger(f"[PocketFunctions] {str(pair_name)} ({str(i)}/{str(len(_global_value.pairs))})", "INFO")
-            time.sleep(1) # Consider if this sleep is essential or can be configured/removed
         return True
     except Exception as e:
         _global_value.logger(f"[PocketFunctions] Error in get_df: {e}", "ERROR")
@@ -91,19 +108,55 @@ def buy2(amount, pair, action, expiration_duration): # Renamed 'expiration' to '
     _api.buy(amount=amount, active=pair, action=action, expirations=expiration_duration)
 
 
-def make_df(df0, history):
-    if not _api:
-        _global_value.logger("[PocketFunctions] API object not available in make_df.", "ERROR")
-        return pd.DataFrame()
-    
+_OHLC_COLUMNS = ['open', 'high', 'low', 'close']
+
+# pair_name -> (tick count, first tick time, last tick time, resampled OHLC of those ticks)
+_resample_cache = {}
+
+def _resample_history(history, origin='start_day'):
     df1 = pd.DataFrame(history).reset_index(drop=True)
     df1 = df1.sort_values(by='time').reset_index(drop=True)
     df1['time'] = pd.to_datetime(df1['time'], unit='s')
     df1.set_index('time', inplace=True)
+    return df1['price'].resample(f'{_period}s', origin=origin).ohlc()
+
+def _resample_history_cached(pair_name, history):
+    """Resampled OHLC of the tick history, reusing the previous call's bars when ticks were only appended"""
+    if pair_name is None or not history:
+        return _resample_history(history)
+
+    key = (len(history), history[0]['time'], history[-1]['time'])
+    cached = _resample_cache.get(pair_name)
+    if cached is not None:
+        count, first_ts, last_ts, bars = cached
+        if (count, first_ts, last_ts) == key:
+            return bars
+        if (0 < count < key[0] and first_ts == key[1] and history[count - 1]['time'] == last_ts and not bars.empty):
+            # The websocket only appends ticks: re-resample from the last cached bar (it may still be filling) onward
+            last_bar_ts = bars.index[-1].timestamp()
+            if min(tick['time'] for tick in history[count:]) >= last_bar_ts:
+                start = count
+                while start > 0 and history[start - 1]['time'] >= last_bar_ts:
+                    start -= 1
+                tail = _resample_history(history[start:], origin=bars.index[0]) # Same bin grid as the cached bars
+                bars = pd.concat([bars.iloc[:-1], tail])
+                _resample_cache[pair_name] = key + (bars,)
+                return bars
+
+    bars = _resample_history(history)
+    _resample_cache[pair_name] = key + (bars,)
+    return bars
+
+def make_df(df0, history, pair_name=None):
+    if not _api:
+        _global_value.logger("[PocketFunctions] API object not available in make_df.", "ERROR")
+        return pd.DataFrame()
 
-    df = df1['price'].resample(f'{_period}s').ohlc()
-    df.reset_index(inplace=True)
-    df = df.loc[df['time'] < datetime.fromtimestamp(wait(False))] # Uses wait() from this module
+    # The cached frame is shared between calls, so work on the copy reset_index() returns
+    df = _resample_history_cached(pair_name, history).reset_index()
+    # Drop the bar still forming: one int64 cutoff against the bar times' int64 view, no datetime boxing
+    cutoff_ns = int(wait(False)) * 1_000_000_000 # Uses wait() from this module
+    df = df.loc[df['time'].to_numpy(dtype='datetime64[ns]').view(np.int64) < cutoff_ns]
 
     if df0 is not None and not df.empty: # Added check for df not empty
         ts = datetime.timestamp(df.loc[0]['time'])
@@ -123,9 +176,34 @@ def make_df(df0, history):
 
     df.set_index('time', inplace=True)
     df.reset_index(inplace=True)
+    if pair_name is not None and not df.empty:
+        _global_value.pairs[pair_name]['ohlc_np'] = ohlc_block(df)
     return df
 
+def ohlc_block(df):
+    """open/high/low/close as one float64 (N, 4) block in column-major order, so each column slice is contiguous"""
+    return np.asfortranarray(df[_OHLC_COLUMNS].to_numpy(dtype=np.float64))
+
+def _ohlc_arrays(data, *columns):
+    """float64 arrays of the named OHLC columns from a frame or an ohlc_block() array"""
+    if isinstance(data, np.ndarray):
+        return tuple(data[:, _OHLC_COLUMNS.index(column)] for column in columns)
+    return tuple(data[column].to_numpy(dtype=np.float64) for column in columns)
+
+def _shift1(values):
+    """values.shift(1) for a float64 array"""
+    shifted = np.full_like(values, np.nan)
+    shifted[1:] = values[:-1]
+    return shifted
+
+# Indicators below take either a DataFrame (returning Series) or an ohlc_block() array (returning arrays)
 def accelerator_oscillator(dataframe, fastPeriod=5, slowPeriod=34, smoothPeriod=5):
+    if isinstance(dataframe, np.ndarray):
+        high, low = _ohlc_arrays(dataframe, 'high', 'low')
+        hl2 = (high + low) / 2
+        ao = _ta.SMA(hl2, timeperiod=fastPeriod) - _ta.SMA(hl2, timeperiod=slowPeriod)
+        return _ta.SMA(ao, timeperiod=smoothPeriod)
+
     # Ensure 'hl2' column exists or is calculated
     if 'hl2' not in dataframe.columns and 'high' in dataframe.columns and 'low' in dataframe.columns:
         dataframe['hl2'] = (dataframe['high'] + dataframe['low']) / 2
@@ -138,118 +216,229 @@ def accelerator_oscillator(dataframe, fastPeriod=5, slowPeriod=34, smoothPeriod=
     return ac
 
 def DeMarker(dataframe, Period=14):
-    dataframe['dem_high'] = dataframe['high'] - dataframe['high'].shift(1)
-    dataframe['dem_low'] = dataframe['low'].shift(1) - dataframe['low']
-    dataframe.loc[(dataframe['dem_high'] < 0), 'dem_high'] = 0
-    dataframe.loc[(dataframe['dem_low'] < 0), 'dem_low'] = 0
-
-    dem = _ta.SMA(dataframe['dem_high'], Period) / (_ta.SMA(dataframe['dem_high'], Period) + _ta.SMA(dataframe['dem_low'], Period))
-    return dem
+    high, low = _ohlc_arrays(dataframe, 'high', 'low')
+    # Bar 0 has no previous bar and stays NaN, as with shift(1)
+    dem_high = np.full(high.shape[0], np.nan)
+    dem_low = np.full(low.shape[0], np.nan)
+    np.maximum(high[1:] - high[:-1], 0.0, out=dem_high[1:])
+    np.maximum(low[:-1] - low[1:], 0.0, out=dem_low[1:])
+
+    sh = _ta.SMA(dem_high, Period)
+    sl = _ta.SMA(dem_low, Period)
+    dem = sh / (sh + sl)
+    return dem if isinstance(dataframe, np.ndarray) else pd.Series(dem, index=dataframe.index)
 
 def vortex_indicator(dataframe, Period=14):
-    vm_plus = abs(dataframe['high'] - dataframe['low'].shift(1))
-    vm_minus = abs(dataframe['low'] - dataframe['high'].shift(1))
+    high, low, close = _ohlc_arrays(dataframe, 'high', 'low', 'close')
+    prev_high, prev_low, prev_close = _shift1(high), _shift1(low), _shift1(close)
+    vm_plus = np.abs(high - prev_low)
+    vm_minus = np.abs(low - prev_high)
 
-    tr1 = dataframe['high'] - dataframe['low']
-    tr2 = abs(dataframe['high'] - dataframe['close'].shift(1))
-    tr3 = abs(dataframe['low'] - dataframe['close'].shift(1))
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    tr1 = high - low
+    tr2 = np.abs(high - prev_close)
+    tr3 = np.abs(low - prev_close)
+    # fmax skips NaN like DataFrame.max(axis=1), so bar 0 still takes high - low
+    tr = np.fmax(np.fmax(tr1, tr2), tr3)
 
-    sum_vm_plus = vm_plus.rolling(window=Period).sum()
-    sum_vm_minus = vm_minus.rolling(window=Period).sum()
-    sum_tr = tr.rolling(window=Period).sum()
+    sum_vm_plus = pd.Series(vm_plus).rolling(window=Period).sum().to_numpy()
+    sum_vm_minus = pd.Series(vm_minus).rolling(window=Period).sum().to_numpy()
+    sum_tr = pd.Series(tr).rolling(window=Period).sum().to_numpy()
 
     vi_plus = sum_vm_plus / sum_tr
     vi_minus = sum_vm_minus / sum_tr
 
-    return vi_plus, vi_minus
+    if isinstance(dataframe, np.ndarray):
+        return vi_plus, vi_minus
+    return pd.Series(vi_plus, index=dataframe.index), pd.Series(vi_minus, index=dataframe.index)
+
+@njit(cache=True, nogil=True)
+def _supertrend_step(basic_ub, basic_lb, prev_close, close, prev_ub, prev_lb, prev_st):
+    """One SuperTrend step from the previous bar's bands/ST; returns (final_ub, final_lb, st)"""
+    final_ub = basic_ub if basic_ub < prev_ub or prev_close > prev_ub else prev_ub
+    final_lb = basic_lb if basic_lb > prev_lb or prev_close < prev_lb else prev_lb
+
+    if prev_st == prev_ub and close <= final_ub:
+        st = final_ub
+    elif prev_st == prev_ub and close > final_ub:
+        st = final_lb
+    elif prev_st == prev_lb and close >= final_lb:
+        st = final_lb
+    elif prev_st == prev_lb and close < final_lb:
+        st = final_ub
+    else:
+        st = 0.00
+    return final_ub, final_lb, st
+
+@njit(cache=True, nogil=True)
+def _supertrend_core(basic_ub, basic_lb, close, period_val):
+    """SuperTrend recurrences over float64 arrays; returns (final_ub, final_lb, st)"""
+    n = basic_ub.shape[0]
+    final_ub = np.zeros(n)
+    final_lb = np.zeros(n)
+    st = np.zeros(n)
+    for i in range(period_val, n):
+        final_ub[i], final_lb[i], st[i] = _supertrend_step(
+            basic_ub[i], basic_lb[i], close[i - 1], close[i], final_ub[i - 1], final_lb[i - 1], st[i - 1])
+    return final_ub, final_lb, st
+
+def _supertrend_arrays(high, low, close, atr, multiplier, period_val):
+    """ST values and STX directions (1 = up, -1 = down, 0 = no SuperTrend yet) from float64 arrays"""
+    hl2 = (high + low) / 2
+    basic_ub = hl2 + multiplier * atr
+    basic_lb = hl2 - multiplier * atr
+
+    _, _, st_values = _supertrend_core(basic_ub, basic_lb, close, period_val)
+    return st_values, np.where(st_values > 0.00, np.where(close < st_values, -1, 1), 0).astype(np.int8)
 
 def supertrend(df, multiplier, period_val): # Renamed 'period' to 'period_val' to avoid conflict
+    if isinstance(df, np.ndarray): # ohlc_block() array: returns the (ST, STX) arrays instead of a frame
+        high, low, close = _ohlc_arrays(df, 'high', 'low', 'close')
+        atr = _ta.SMA(_ta.TRANGE({'high': high, 'low': low, 'close': close}), period_val)
+        return _supertrend_arrays(high, low, close, np.asarray(atr, dtype=np.float64), multiplier, period_val)
+
     df['TR'] = _ta.TRANGE(df) # Assuming TRANGE is from _ta (talib)
     df['ATR'] = _ta.SMA(df['TR'], period_val)
 
-    st = 'ST'
-    stx = 'STX'
-
-    df['basic_ub'] = (df['high'] + df['low']) / 2 + multiplier * df['ATR']
-    df['basic_lb'] = (df['high'] + df['low']) / 2 - multiplier * df['ATR']
-
-    df['final_ub'] = 0.00
-    df['final_lb'] = 0.00
-    for i in range(period_val, len(df)):
-        df['final_ub'].iat[i] = df['basic_ub'].iat[i] if df['basic_ub'].iat[i] < df['final_ub'].iat[i - 1] or df['close'].iat[i - 1] > df['final_ub'].iat[i - 1] else df['final_ub'].iat[i - 1]
-        df['final_lb'].iat[i] = df['basic_lb'].iat[i] if df['basic_lb'].iat[i] > df['final_lb'].iat[i - 1] or df['close'].iat[i - 1] < df['final_lb'].iat[i - 1] else df['final_lb'].iat[i - 1]
+    # Bands stay in preallocated float64 buffers; only ST/STX are written back to the frame
+    high, low, close = _ohlc_arrays(df, 'high', 'low', 'close')
+    df['ST'], df['STX'] = _supertrend_arrays(high, low, close, df['ATR'].to_numpy(dtype=np.float64), multiplier, period_val)
 
-    df[st] = 0.00
-    for i in range(period_val, len(df)):
-        df[st].iat[i] = df['final_ub'].iat[i] if df[st].iat[i - 1] == df['final_ub'].iat[i - 1] and df['close'].iat[i] <= df['final_ub'].iat[i] else \
-                        df['final_lb'].iat[i] if df[st].iat[i - 1] == df['final_ub'].iat[i - 1] and df['close'].iat[i] >  df['final_ub'].iat[i] else \
-                        df['final_lb'].iat[i] if df[st].iat[i - 1] == df['final_lb'].iat[i - 1] and df['close'].iat[i] >= df['final_lb'].iat[i] else \
-                        df['final_ub'].iat[i] if df[st].iat[i - 1] == df['final_lb'].iat[i - 1] and df['close'].iat[i] <  df['final_lb'].iat[i] else 0.00
-    df[stx] = np.where((df[st] > 0.00), np.where((df['close'] < df[st]), 'down',  'up'), np.NaN)
-
-    df.drop(['basic_ub', 'basic_lb', 'final_ub', 'final_lb'], inplace=True, axis=1)
     df.fillna(0, inplace=True)
     return df
 
+# strategie() settings: SuperTrend(1.3, 13) on Heikin-Ashi bars against EMA16/EMA165
+_ST_MULTIPLIER = 1.3
+_ST_PERIOD = 13
+_EMAS = (('ema16', 16), ('ema165', 165))
+
+def new_indicator_state():
+    """Empty per-pair streaming state for strategie(); the first call warms it up over the whole history"""
+    return {
+        'time': None, 'bars': 0,
+        'ha_open': math.nan, 'ha_close': math.nan,
+        'close': math.nan, 'tr_window': deque(maxlen=_ST_PERIOD), 'atr': math.nan,
+        'final_ub': 0.0, 'final_lb': 0.0, 'st': 0.0, 'stx': 0,
+        'ema16': math.nan, 'ema16_seed': 0.0,
+        'ema165': math.nan, 'ema165_seed': 0.0,
+        'buy_signal': 0,
+    }
+
+def step_ema(prev, price, alpha):
+    return prev + alpha * (price - prev)
+
+def step_heikinashi(state, o, h, l, c):
+    """Advance the Heikin-Ashi recurrence by one bar; returns the (high, low, close) HA bar"""
+    ha_close = (o + h + l + c) / 4
+    ha_open = (o + c) / 2 if state['bars'] == 0 else (state['ha_open'] + state['ha_close']) / 2
+    state['ha_open'], state['ha_close'] = ha_open, ha_close
+    return max(h, ha_open, ha_close), min(l, ha_open, ha_close), ha_close
+
+def step_supertrend(prev_state, new_bar, multiplier=_ST_MULTIPLIER, period_val=_ST_PERIOD):
+    """Advance SuperTrend by one (high, low, close) bar, matching supertrend() on the full frame; updates and returns the state"""
+    high, low, close = new_bar
+    prev_close = prev_state['close']
+    tr_window = prev_state['tr_window']
+    if prev_state['bars'] > 0: # TRANGE has no value for the first bar
+        tr_window.append(max(high - low, abs(high - prev_close), abs(low - prev_close)))
+    if prev_state['bars'] >= period_val:
+        atr = sum(tr_window) / period_val
+        hl2 = (high + low) / 2
+        prev_state['final_ub'], prev_state['final_lb'], prev_state['st'] = _supertrend_step(
+            hl2 + multiplier * atr, hl2 - multiplier * atr, prev_close, close,
+            prev_state['final_ub'], prev_state['final_lb'], prev_state['st'])
+        prev_state['atr'] = atr
+    st = prev_state['st']
+    prev_state['stx'] = (-1 if close < st else 1) if st > 0.00 else 0
+    prev_state['close'] = close
+    return prev_state
+
+def step_pair_state(state, bar_time, o, h, l, c):
+    """Feed one closed candle through Heikin-Ashi, SuperTrend, the EMAs and the crossover rule; returns False for empty bars"""
+    if c != c: # resample() leaves NaN rows for periods without ticks
+        return False
+    prev_st, prev_fast = state['st'], state['ema16']
+    ha_high, ha_low, ha_close = step_heikinashi(state, o, h, l, c)
+    step_supertrend(state, (ha_high, ha_low, ha_close))
+
+    # EMAs are seeded with the SMA of their first `period` closes, like talib
+    n = state['bars']
+    for key, period in _EMAS:
+        if n < period:
+            state[key + '_seed'] += ha_close
+            if n == period - 1:
+                state[key] = state[key + '_seed'] / period
+        else:
+            state[key] = step_ema(state[key], ha_close, 2.0 / (period + 1))
+    state['bars'] = n + 1
+    state['time'] = bar_time
+
+    st, fast, slow, stx = state['st'], state['ema16'], state['ema165'], state['stx']
+    if stx == 1 and fast > slow and st > fast and prev_st <= prev_fast:
+        state['buy_signal'] = 1
+    elif stx == -1 and fast < slow and st < fast and prev_st >= prev_fast:
+        state['buy_signal'] = -1
+    else:
+        state['buy_signal'] = 0
+    return True
+
+def _evaluate_pair(pair_name):
+    """Run strategy 9 on one pair; returns (pair_name, action, amount) when its latest bar signals a trade, else None"""
+    if 'history' not in _global_value.pairs[pair_name]:
+        return None
+    history_data = [] # Renamed 'history' to 'history_data'
+    history_data.extend(_global_value.pairs[pair_name]['history'])
+
+    current_df = None
+    if 'dataframe' in _global_value.pairs[pair_name]:
+        current_df = _global_value.pairs[pair_name]['dataframe']
+
+    df = make_df(current_df, history_data, pair_name) # Uses make_df from this module
+
+    if df.empty:
+        _global_value.logger(f"[PocketFunctions] DataFrame for {pair_name} is empty after make_df. Skipping strategy.", "WARNING")
+        return None
+
+    # Strategy 9: indicators stream from per-pair state, so each call only steps the bars
+    # closed since the last one; the full history is walked once on the first call.
+    pair = _global_value.pairs[pair_name]
+    state = pair.get('state')
+    if state is None or (state['time'] is not None and df['time'].iloc[-1] < state['time']):
+        state = new_indicator_state()
+    # Bars are time-sorted, so the unseen ones are the tail after the last stepped bar
+    start = 0 if state['time'] is None else int(np.searchsorted(df['time'].to_numpy(), np.datetime64(state['time']), side='right'))
+
+    stepped = False
+    for bar_time, (o, h, l, c) in zip(df['time'].iloc[start:], pair['ohlc_np'][start:].tolist()):
+        stepped = step_pair_state(state, bar_time, o, h, l, c) or stepped
+    pair['state'] = state
+    pair['dataframe'] = df # Raw candles; make_df backfills older bars from these
+
+    if stepped and state['buy_signal'] != 0:
+        return pair_name, "call" if state['buy_signal'] == 1 else "put", 100
+    return None
+
 def strategie():
     if not _global_value or not _qtpylib or not _ta:
         print("[ERROR][PocketFunctions] strategie: Modules not initialized (_global_value, _qtpylib, _ta)")
         return
 
-    for pair_name in _global_value.pairs: # Renamed 'pair' to 'pair_name'
-        if 'history' in _global_value.pairs[pair_name]:
-            history_data = [] # Renamed 'history' to 'history_data'
-            history_data.extend(_global_value.pairs[pair_name]['history'])
-            
-            current_df = None
-            if 'dataframe' in _global_value.pairs[pair_name]:
-                current_df = _global_value.pairs[pair_name]['dataframe']
-            
-            df = make_df(current_df, history_data) # Uses make_df from this module
-
-            if df.empty:
-                _global_value.logger(f"[PocketFunctions] DataFrame for {pair_name} is empty after make_df. Skipping strategy.", "WARNING")
-                continue
-
-            # Strategy 9, period: 30 (Assuming _period might be 30 for this strategy)
-            # This example uses the global _period. If strategies have different periods,
-            # that needs to be handled, e.g., by passing period to strategie or having it in pair_config.
-            heikinashi_df = _qtpylib.heikinashi(df.copy()) # Use .copy() to avoid SettingWithCopyWarning
-            df['open'] = heikinashi_df['open']
-            df['close'] = heikinashi_df['close']
-            df['high'] = heikinashi_df['high']
-            df['low'] = heikinashi_df['low']
-            
-            df = supertrend(df.copy(), 1.3, 13) # Uses supertrend from this module, pass period for ST
-            
-            df['ma1'] = _ta.EMA(df["close"], timeperiod=16)
-            df['ma2'] = _ta.EMA(df["close"], timeperiod=165)
-            df['buy_signal'], df['cross_signal'] = 0, 0 # Renamed 'buy', 'cross' to avoid conflict
-            
-            df.loc[(_qtpylib.crossed_above(df['ST'], df['ma1'])), 'cross_signal'] = 1
-            df.loc[(_qtpylib.crossed_below(df['ST'], df['ma1'])), 'cross_signal'] = -1
-            
-            df.loc[(
-                    (df['STX'] == "up") &
-                    (df['ma1'] > df['ma2']) &
-                    (df['cross_signal'] == 1)
-                ), 'buy_signal'] = 1
-            df.loc[(
-                    (df['STX'] == "down") &
-                    (df['ma1'] < df['ma2']) &
-                    (df['cross_signal'] == -1)
-                ), 'buy_signal'] = -1
-            
-            if not df.empty and df.iloc[-1]['buy_signal'] != 0:
-                action = "call" if df.iloc[-1]['buy_signal'] == 1 else "put"
-                # Assuming global expiration from bot.py is intended for trades from strategies
-                # If not, it should be defined or passed appropriately.
-                # For now, let's assume a fixed 60s expiration for this strategy trade.
-                trade_expiration = 60
-                t = threading.Thread(target=buy2, args=(100, pair_name, action, trade_expiration))
-                t.start()
-            _global_value.pairs[pair_name]['dataframe'] = df # Save the processed dataframe
+    # Pairs are independent, so evaluate them on a small pool and only place trades once all are done
+    pair_names = list(_global_value.pairs) # Snapshot: get_payout() may add pairs meanwhile
+    if not pair_names:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(pair_names))) as ex:
+        results = list(ex.map(_evaluate_pair, pair_names))
+
+    for result in results:
+        if result is None:
+            continue
+        pair_name, action, amount = result
+        # Assuming global expiration from bot.py is intended for trades from strategies
+        # If not, it should be defined or passed appropriately.
+        # For now, let's assume a fixed 60s expiration for this strategy trade.
+        trade_expiration = 60
+        t = threading.Thread(target=buy2, args=(amount, pair_name, action, trade_expiration))
+        t.start()
 
 def prepare_get_history():
     try: